@@ -1,5 +1,7 @@
 """Main API module."""
 
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from typing import Union
 
 from fastapi import FastAPI, HTTPException
@@ -20,21 +22,35 @@ from prod_health_guardian.models import (
     MemoryMetrics,
 )
 
+# Initialize collectors
+cpu_collector = CPUCollector()
+memory_collector = MemoryCollector()
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
+    """Start the metrics collector and release it when the app shuts down.
+
+    Args:
+        _: The FastAPI application.
+
+    Yields:
+        None: Control while the app serves requests.
+    """
+    get_collector()
+    yield
+    get_collector().close()
+
+
 app = FastAPI(
     title="Production Health Guardian",
     description="API for monitoring system health and metrics",
     version=__version__,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    lifespan=lifespan,
 )
 
-# Initialize collectors
-cpu_collector = CPUCollector()
-memory_collector = MemoryCollector()
-
-# Initialize metrics collector
-metrics_collector = get_collector()
-
 
 @app.get(
     "/",
@@ -147,7 +163,7 @@ async def get_json_metrics() -> dict[str, Union[CPUMetrics, MemoryMetrics, GPUMe
         HTTPException: If metrics collection fails
     """
     try:
-        metrics = await metrics_collector.collect_metrics()
+        metrics = await get_collector().collect_metrics()
         return {
             "cpu": metrics.cpu,
             "memory": metrics.memory,
@@ -1,6 +1,7 @@
 """Base collector module."""
 
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Any
 
 
@@ -24,10 +25,14 @@ class BaseCollector(ABC):
         """
         raise NotImplementedError
 
-    @property
+    @cached_property
     def is_available(self) -> bool:
         """Check if the collector can collect metrics on this system.
 
+        The check runs once per collector instance and is cached, so
+        subclasses may probe hardware here without repeating the probe on
+        every access.
+
         Returns:
             bool: True if collector can collect metrics, False otherwise.
         """
@@ -1,11 +1,106 @@
 """CPU metrics collector module."""
 
-from typing import Union
+from collections import namedtuple
+from typing import Any, Optional, Union
 
 import psutil
 
 from .base import BaseCollector
 
+# Kernel CPU and scheduler counters; absent on non-Linux hosts
+PROC_STAT = "/proc/stat"
+
+# Column layout of the cpu lines in /proc/stat, in USER_HZ ticks
+_ProcCPUTimes = namedtuple(
+    "_ProcCPUTimes",
+    "user nice system idle iowait irq softirq steal guest guest_nice",
+    defaults=(0.0,) * 10,
+)
+
+# Counter lines in /proc/stat and the metric each one maps to
+_PROC_STAT_COUNTERS = {
+    b"ctxt": "ctx_switches",
+    b"intr": "interrupts",
+    b"softirq": "soft_interrupts",
+}
+
+# Time fields that count towards idle rather than busy CPU time
+IDLE_FIELDS = ("idle", "iowait")
+# Linux folds guest time into user/nice, so it is dropped from the total
+GUEST_FIELDS = ("guest", "guest_nice")
+
+
+def _busy_percent(previous: Any, current: Any) -> Optional[float]:
+    """Compute CPU usage between two ``psutil.cpu_times`` snapshots.
+
+    Args:
+        previous: Earlier CPU times snapshot.
+        current: Later CPU times snapshot.
+
+    Returns:
+        Optional[float]: Busy time as a percentage of elapsed CPU time, or
+            None when no time has elapsed between the snapshots.
+    """
+
+    def split(times: Any) -> tuple[float, float]:
+        fields = times._asdict()
+        total = sum(fields.values()) - sum(fields.get(f, 0.0) for f in GUEST_FIELDS)
+        idle = sum(fields.get(f, 0.0) for f in IDLE_FIELDS)
+        return total, total - idle
+
+    prev_total, prev_busy = split(previous)
+    curr_total, curr_busy = split(current)
+    elapsed = curr_total - prev_total
+    if elapsed <= 0:
+        return None
+    percent = (curr_busy - prev_busy) / elapsed * 100
+    return round(min(max(percent, 0.0), 100.0), 1)
+
+
+def _read_proc_stat() -> Optional[dict[str, Any]]:
+    """Read CPU times and counters from a single /proc/stat read.
+
+    psutil opens /proc/stat separately for total times, per-CPU times and
+    CPU stats; reading it once and parsing it here yields all of them.
+
+    Returns:
+        Optional[dict[str, Any]]: CPU times, per-CPU times and counters, or
+            None when /proc/stat is unavailable (e.g. on non-Linux hosts).
+    """
+    try:
+        with open(PROC_STAT, "rb") as f:
+            rows = [line.split() for line in f.read().splitlines() if line]
+    except OSError:
+        return None
+
+    # Linux does not count syscalls; psutil reports 0 there as well
+    stat: dict[str, Any] = {"per_cpu_times": [], "syscalls": 0}
+    for name, *values in rows:
+        if name == b"cpu":
+            stat["times"] = _ProcCPUTimes(*map(float, values[:10]))
+        elif name.startswith(b"cpu"):
+            stat["per_cpu_times"].append(_ProcCPUTimes(*map(float, values[:10])))
+        elif name in _PROC_STAT_COUNTERS:
+            stat[_PROC_STAT_COUNTERS[name]] = int(values[0])
+    return stat if "times" in stat else None
+
+
+def _psutil_stat() -> dict[str, Any]:
+    """Read CPU times and counters through psutil.
+
+    Returns:
+        dict[str, Any]: Same layout as _read_proc_stat.
+    """
+    cpu_stats = psutil.cpu_stats()
+    return {
+        "times": psutil.cpu_times(),
+        "per_cpu_times": psutil.cpu_times(percpu=True),
+        "ctx_switches": cpu_stats.ctx_switches,
+        "interrupts": cpu_stats.interrupts,
+        "soft_interrupts": cpu_stats.soft_interrupts,
+        "syscalls": cpu_stats.syscalls,
+    }
+
 
 class CPUCollector(BaseCollector):
     """CPU metrics collector.
@@ -20,10 +115,20 @@ class CPUCollector(BaseCollector):
     def __init__(self, interval: float = 1.0) -> None:
         """Initialize CPU collector.
 
+        Usage percentages are computed from the CPU time elapsed since the
+        previous collection, so ``collect`` never sleeps. The first baseline
+        is taken here, along with the core counts, which do not change.
+
         Args:
-            interval: Time interval in seconds for CPU percentage calculation.
+            interval: Nominal time interval in seconds between collections.
         """
         self.interval = interval
+        self._physical_cores = psutil.cpu_count(logical=False)
+        self._logical_cores = psutil.cpu_count(logical=True)
+        self._stat = _read_proc_stat() or _psutil_stat()
+        # Last readings, reported again when no CPU time has elapsed
+        self._cpu_percent = 0.0
+        self._per_cpu_percent: list[float] = []
 
     def get_name(self) -> str:
         """Get collector name.
@@ -42,8 +147,8 @@ class CPUCollector(BaseCollector):
         """
         # Get CPU counts
         metrics = {
-            "physical_cores": psutil.cpu_count(logical=False),
-            "logical_cores": psutil.cpu_count(logical=True),
+            "physical_cores": self._physical_cores,
+            "logical_cores": self._logical_cores,
         }
 
         # Get CPU frequencies
@@ -57,17 +162,25 @@ class CPUCollector(BaseCollector):
             metrics["cpu_freq_min"] = 0.0
             metrics["cpu_freq_max"] = 0.0
 
-        # Get CPU usage percentages
-        metrics["cpu_percent"] = psutil.cpu_percent(interval=self.interval)
-        metrics["per_cpu_percent"] = psutil.cpu_percent(
-            interval=self.interval, percpu=True
-        )
-
-        # Get CPU statistics
-        cpu_stats = psutil.cpu_stats()
-        metrics["ctx_switches"] = cpu_stats.ctx_switches
-        metrics["interrupts"] = cpu_stats.interrupts
-        metrics["soft_interrupts"] = cpu_stats.soft_interrupts
-        metrics["syscalls"] = cpu_stats.syscalls
+        # Get CPU usage percentages since the previous snapshot, and stats.
+        # Within one clock tick of the previous collection there is no new
+        # sample, so the previous reading is kept instead of reporting idle.
+        previous, stat = self._stat, _read_proc_stat() or _psutil_stat()
+        percent = _busy_percent(previous["times"], stat["times"])
+        if percent is not None:
+            self._cpu_percent = percent
+        last, per_cpu_percent = self._per_cpu_percent, []
+        per_cpu_times = zip(previous["per_cpu_times"], stat["per_cpu_times"])
+        for core, (before, after) in enumerate(per_cpu_times):
+            core_percent = _busy_percent(before, after)
+            if core_percent is None:
+                core_percent = last[core] if core < len(last) else 0.0
+            per_cpu_percent.append(core_percent)
+        self._per_cpu_percent = per_cpu_percent
+        metrics["cpu_percent"] = self._cpu_percent
+        metrics["per_cpu_percent"] = list(self._per_cpu_percent)
+        for name in ("ctx_switches", "interrupts", "soft_interrupts", "syscalls"):
+            metrics[name] = stat.get(name, 0)
+        self._stat = stat
 
         return metrics
@@ -1,7 +1,10 @@
 """GPU metrics collector module."""
 
 import logging
-from typing import Union
+import os
+import sys
+import threading
+from typing import Optional, Union
 
 import pynvml
 
@@ -9,6 +12,50 @@ from .base import BaseCollector
 
 logger = logging.getLogger(__name__)
 
+# Created by the NVIDIA kernel driver; absent on Linux hosts without one
+NVIDIA_PROC_DIR = "/proc/driver/nvidia"
+# GPU paravirtualization device under WSL2, where NVML works through the
+# Windows driver and NVIDIA_PROC_DIR does not exist
+WSL_GPU_DEVICE = "/dev/dxg"
+
+
+def _nvidia_driver_present() -> bool:
+    """Cheaply check whether an NVIDIA driver could be present.
+
+    On Linux this looks for the driver's procfs directory or the WSL2 GPU
+    device, which avoids loading and initializing NVML on hosts without
+    NVIDIA hardware. Other platforms have no equally cheap probe, so NVML
+    is always tried there.
+
+    Returns:
+        bool: False only when the host is known to have no NVIDIA driver.
+    """
+    if sys.platform.startswith("linux"):
+        return os.path.isdir(NVIDIA_PROC_DIR) or os.path.exists(WSL_GPU_DEVICE)
+    return True
+
+
+def _default_metrics(name: str) -> dict[str, Union[int, float, str]]:
+    """Build the zeroed metrics reported when no GPU reading is available.
+
+    Args:
+        name: Placeholder device name, e.g. "No GPU" or "Error".
+
+    Returns:
+        dict[str, Union[int, float, str]]: GPU metrics with all values zeroed.
+    """
+    return {
+        "name": name,
+        "temperature": 0.0,
+        "power_watts": 0.0,
+        "memory_total": 0,
+        "memory_used": 0,
+        "memory_free": 0,
+        "gpu_utilization": 0.0,
+        "memory_utilization": 0.0,
+        "fan_speed": 0.0,
+    }
+
 
 class GPUCollector(BaseCollector):
     """NVIDIA GPU metrics collector.
@@ -21,20 +68,31 @@ class GPUCollector(BaseCollector):
     - Fan speed
 
     The collector uses NVIDIA's NVML library through pynvml to access
-    GPU metrics. If no NVIDIA GPU is available or if there are any
-    errors accessing the GPU, the collector will return default metrics.
+    GPU metrics. A daemon thread polls NVML every interval and keeps the
+    latest snapshot, which collect() returns. If no NVIDIA GPU is available
+    or if there are any errors accessing the GPU, the collector will return
+    default metrics.
     """
 
     def __init__(self, interval: float = 1.0) -> None:
         """Initialize GPU collector.
 
         Args:
-            interval: Time interval in seconds for metric collection.
+            interval: Time interval in seconds between NVML polls.
         """
         self.interval = interval
         self.has_nvidia = False
         self.device_count = 0
         self.handle = None
+        # Device name is static, so it is read from NVML once and reused
+        self._name: Optional[str] = None
+        self._snapshot = _default_metrics("No GPU")
+        self._stop = threading.Event()
+        self._poller: Optional[threading.Thread] = None
+
+        if not _nvidia_driver_present():
+            logger.info("No NVIDIA driver found, skipping NVML initialization")
+            return
 
         try:
             pynvml.nvmlInit()
@@ -43,9 +101,16 @@ class GPUCollector(BaseCollector):
             if self.device_count > 0:
                 self.handle = pynvml.nvmlDeviceGetHandleByIndex(0)
             logger.info("NVML initialized with %d GPU(s)", self.device_count)
-        except Exception as e:
+        except pynvml.NVMLError as e:
             logger.warning("Failed to initialize NVML: %s", str(e))
 
+        if self.handle is not None:
+            self._poll_safely()
+            self._poller = threading.Thread(
+                target=self._poll_loop, name="gpu-poller", daemon=True
+            )
+            self._poller.start()
+
     def get_name(self) -> str:
         """Get collector name.
 
@@ -57,27 +122,67 @@ class GPUCollector(BaseCollector):
     async def collect(self) -> dict[str, Union[int, float, str]]:
         """Collect GPU metrics.
 
+        The readings come from the latest snapshot taken by the background
+        poller, so a scrape never waits on NVML.
+
         Returns:
             dict[str, Union[int, float, str]]: GPU metrics including temperature,
                 memory usage, utilization, etc. If no GPU is available or on error,
                 returns default metrics with zeros.
         """
         if not self.has_nvidia or not self.handle:
-            return {
-                "name": "No GPU",
-                "temperature": 0.0,
-                "power_watts": 0.0,
-                "memory_total": 0,
-                "memory_used": 0,
-                "memory_free": 0,
-                "gpu_utilization": 0.0,
-                "memory_utilization": 0.0,
-                "fan_speed": 0.0,
-            }
+            return _default_metrics("No GPU")
+        return dict(self._snapshot)
+
+    def close(self) -> None:
+        """Stop the background poller and release NVML.
+
+        Waits for the poller to exit, then shuts down the NVML session
+        opened in __init__. Afterwards collect() reports "No GPU" rather
+        than the last snapshot. Calling close() again does nothing.
+        """
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        if self._poller is not None:
+            self._poller.join()
+        if self.has_nvidia:
+            try:
+                pynvml.nvmlShutdown()
+            except pynvml.NVMLError as e:
+                logger.warning("Failed to shut down NVML: %s", str(e))
+        self.has_nvidia = False
+        self.handle = None
+
+    def _poll_loop(self) -> None:
+        """Refresh the snapshot every interval until close() is called."""
+        while not self._stop.wait(self.interval):
+            self._poll_safely()
 
+    def _poll_safely(self) -> None:
+        """Poll the device, reporting "Error" metrics if the poll fails.
+
+        This is the boundary of the poller thread and of the first poll in
+        __init__: an unexpected error is logged with its traceback rather
+        than killing the thread or the collector's construction.
+        """
         try:
-            # Get basic device info
-            name = pynvml.nvmlDeviceGetName(self.handle).decode()
+            self._poll_once()
+        except Exception:
+            logger.exception("Unexpected error polling GPU metrics")
+            self._snapshot = _default_metrics("Error")
+
+    def _poll_once(self) -> None:
+        """Read the device through NVML and swap in a new snapshot.
+
+        The first NVML error abandons the whole reading, so the remaining
+        device queries are skipped. Other errors propagate to _poll_safely.
+        """
+        try:
+            # Get basic device info; older pynvml releases return bytes
+            if self._name is None:
+                name = pynvml.nvmlDeviceGetName(self.handle)
+                self._name = name.decode() if isinstance(name, bytes) else name
             temp = pynvml.nvmlDeviceGetTemperature(
                 self.handle, pynvml.NVML_TEMPERATURE_GPU
             )
@@ -85,7 +190,7 @@ class GPUCollector(BaseCollector):
             # Get power usage (convert to watts)
             try:
                 power = pynvml.nvmlDeviceGetPowerUsage(self.handle) / 1000.0
-            except Exception:
+            except pynvml.NVMLError:
                 power = 0.0
 
             # Get memory info
@@ -97,11 +202,11 @@ class GPUCollector(BaseCollector):
             # Get fan speed
             try:
                 fan = pynvml.nvmlDeviceGetFanSpeed(self.handle)
-            except Exception:
+            except pynvml.NVMLError:
                 fan = 0.0
 
-            return {
-                "name": name,
+            self._snapshot = {
+                "name": self._name,
                 "temperature": float(temp),
                 "power_watts": float(power),
                 "memory_total": memory.total,
@@ -111,19 +216,9 @@ class GPUCollector(BaseCollector):
                 "memory_utilization": float(utilization.memory),
                 "fan_speed": float(fan),
             }
-        except Exception as e:
+        except pynvml.NVMLError as e:
             logger.error("Error collecting GPU metrics: %s", str(e))
-            return {
-                "name": "Error",
-                "temperature": 0.0,
-                "power_watts": 0.0,
-                "memory_total": 0,
-                "memory_used": 0,
-                "memory_free": 0,
-                "gpu_utilization": 0.0,
-                "memory_utilization": 0.0,
-                "fan_speed": 0.0,
-            }
+            self._snapshot = _default_metrics("Error")
 
     # Alias for backward compatibility
     async def collect_metrics(self) -> dict[str, Union[int, float, str]]:
@@ -1,12 +1,26 @@
 """Metrics collector coordination module."""
 
-from prometheus_client import Gauge, generate_latest
+import weakref
+
+from prometheus_client import REGISTRY, CollectorRegistry, Gauge, generate_latest
 
 from ..collectors.cpu import CPUCollector
 from ..collectors.gpu import GPUCollector
 from ..collectors.memory import MemoryCollector
 from ..models.metrics import CPUMetrics, GPUMetrics, MemoryMetrics, SystemMetrics
 
+# GPU gauge attributes paired with the GPUMetrics field each one exports
+GPU_GAUGE_FIELDS = (
+    ("gpu_temperature", "temperature"),
+    ("gpu_power", "power_watts"),
+    ("gpu_memory_total", "memory_total"),
+    ("gpu_memory_used", "memory_used"),
+    ("gpu_memory_free", "memory_free"),
+    ("gpu_utilization", "gpu_utilization"),
+    ("gpu_memory_utilization", "memory_utilization"),
+    ("gpu_fan_speed", "fan_speed"),
+)
+
 
 class MetricsCollector:
     """Single entry point for all metrics collection and export.
@@ -24,16 +38,52 @@ class MetricsCollector:
     allowing direct registration with the Prometheus registry.
     """
 
-    def __init__(self) -> None:
-        """Initialize metrics collector with hardware collectors and metrics."""
+    def __init__(self, registry: CollectorRegistry = REGISTRY) -> None:
+        """Initialize metrics collector with hardware collectors and metrics.
+
+        Args:
+            registry: Prometheus registry the metrics are registered with and
+                exported from. Defaults to the global registry.
+        """
+        self._registry = registry
+        self._closed = False
+
         # Initialize collectors
         self.cpu_collector = CPUCollector()
         self.memory_collector = MemoryCollector()
         self.gpu_collector = GPUCollector()
+        # The poller thread references only the GPU collector, so stop it
+        # when this collector is garbage collected without being closed
+        weakref.finalize(self, self.gpu_collector.close)
 
         # Register Prometheus metrics
         self._register_metrics()
 
+    @property
+    def closed(self) -> bool:
+        """Whether close() has been called.
+
+        Returns:
+            bool: True once the collector has been closed.
+        """
+        return self._closed
+
+    def close(self) -> None:
+        """Stop background work and unregister the metrics.
+
+        Only the GPU collector runs a poller thread and holds an NVML
+        session; the other collectors have nothing to release. The gauges
+        are removed from the registry so a new collector can register
+        there. Calling close() again does nothing.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self.gpu_collector.close()
+        for metric in vars(self).values():
+            if isinstance(metric, Gauge):
+                self._registry.unregister(metric)
+
     def _register_metrics(self) -> None:
         """Register all Prometheus metrics.
 
@@ -44,139 +94,170 @@ class MetricsCollector:
         self.cpu_physical_count = Gauge(
             "cpu_physical_count",
             "Number of physical CPU cores",
+            registry=self._registry,
         )
         self.cpu_logical_count = Gauge(
             "cpu_logical_count",
             "Number of logical CPU cores",
+            registry=self._registry,
         )
         self.cpu_frequency_current = Gauge(
             "cpu_frequency_current_mhz",
             "Current CPU frequency in MHz",
+            registry=self._registry,
         )
         self.cpu_frequency_min = Gauge(
             "cpu_frequency_min_mhz",
             "Minimum CPU frequency in MHz",
+            registry=self._registry,
         )
         self.cpu_frequency_max = Gauge(
             "cpu_frequency_max_mhz",
             "Maximum CPU frequency in MHz",
+            registry=self._registry,
         )
         self.cpu_percent_total = Gauge(
             "cpu_percent_total",
             "Total CPU usage percentage",
+            registry=self._registry,
         )
         self.cpu_percent_per_cpu = Gauge(
             "cpu_percent_per_cpu",
             "CPU usage percentage per core",
             ["core"],
+            registry=self._registry,
         )
         self.cpu_ctx_switches = Gauge(
             "cpu_ctx_switches_total",
             "Total number of context switches",
+            registry=self._registry,
         )
         self.cpu_interrupts = Gauge(
             "cpu_interrupts_total",
             "Total number of interrupts",
+            registry=self._registry,
         )
         self.cpu_soft_interrupts = Gauge(
             "cpu_soft_interrupts_total",
             "Total number of soft interrupts",
+            registry=self._registry,
         )
         self.cpu_syscalls = Gauge(
             "cpu_syscalls_total",
             "Total number of system calls",
+            registry=self._registry,
         )
 
         # Memory Metrics
         self.memory_virtual_total = Gauge(
             "memory_virtual_total_bytes",
             "Total virtual memory in bytes",
+            registry=self._registry,
         )
         self.memory_virtual_available = Gauge(
             "memory_virtual_available_bytes",
             "Available virtual memory in bytes",
+            registry=self._registry,
         )
         self.memory_virtual_used = Gauge(
             "memory_virtual_used_bytes",
             "Used virtual memory in bytes",
+            registry=self._registry,
         )
         self.memory_virtual_free = Gauge(
             "memory_virtual_free_bytes",
             "Free virtual memory in bytes",
+            registry=self._registry,
         )
         self.memory_virtual_percent = Gauge(
             "memory_virtual_percent",
             "Virtual memory usage percentage",
+            registry=self._registry,
         )
         self.memory_swap_total = Gauge(
             "memory_swap_total_bytes",
             "Total swap memory in bytes",
+            registry=self._registry,
         )
         self.memory_swap_used = Gauge(
             "memory_swap_used_bytes",
             "Used swap memory in bytes",
+            registry=self._registry,
         )
         self.memory_swap_free = Gauge(
             "memory_swap_free_bytes",
             "Free swap memory in bytes",
+            registry=self._registry,
         )
         self.memory_swap_percent = Gauge(
             "memory_swap_percent",
             "Swap memory usage percentage",
+            registry=self._registry,
         )
         self.memory_swap_sin = Gauge(
             "memory_swap_sin_total",
             "Total number of memory pages swapped in",
+            registry=self._registry,
         )
         self.memory_swap_sout = Gauge(
             "memory_swap_sout_total",
             "Total number of memory pages swapped out",
+            registry=self._registry,
         )
 
         # GPU Metrics
         self.gpu_device_count = Gauge(
             "gpu_device_count",
             "Number of NVIDIA GPUs available",
+            registry=self._registry,
         )
         self.gpu_temperature = Gauge(
             "gpu_temperature_celsius",
             "GPU temperature in Celsius",
             ["gpu_id", "name"],
+            registry=self._registry,
         )
         self.gpu_power = Gauge(
             "gpu_power_watts",
             "GPU power usage in Watts",
             ["gpu_id", "name"],
+            registry=self._registry,
         )
         self.gpu_memory_total = Gauge(
             "gpu_memory_total_bytes",
             "Total GPU memory in bytes",
             ["gpu_id", "name"],
+            registry=self._registry,
         )
         self.gpu_memory_used = Gauge(
             "gpu_memory_used_bytes",
             "Used GPU memory in bytes",
             ["gpu_id", "name"],
+            registry=self._registry,
         )
         self.gpu_memory_free = Gauge(
             "gpu_memory_free_bytes",
             "Free GPU memory in bytes",
             ["gpu_id", "name"],
+            registry=self._registry,
         )
         self.gpu_utilization = Gauge(
             "gpu_utilization_percent",
             "GPU utilization percentage",
             ["gpu_id", "name"],
+            registry=self._registry,
         )
         self.gpu_memory_utilization = Gauge(
             "gpu_memory_utilization_percent",
             "GPU memory utilization percentage",
             ["gpu_id", "name"],
+            registry=self._registry,
         )
         self.gpu_fan_speed = Gauge(
             "gpu_fan_speed_percent",
             "GPU fan speed percentage",
             ["gpu_id", "name"],
+            registry=self._registry,
         )
 
     async def collect_metrics(self) -> SystemMetrics:
@@ -242,30 +323,9 @@ class MetricsCollector:
 
         # Update GPU metrics
         gpu_id = "0"  # We currently only support one GPU
-        self.gpu_temperature.labels(gpu_id=gpu_id, name=metrics.gpu.name).set(
-            metrics.gpu.temperature
-        )
-        self.gpu_power.labels(gpu_id=gpu_id, name=metrics.gpu.name).set(
-            metrics.gpu.power_watts
-        )
-        self.gpu_memory_total.labels(gpu_id=gpu_id, name=metrics.gpu.name).set(
-            metrics.gpu.memory_total
-        )
-        self.gpu_memory_used.labels(gpu_id=gpu_id, name=metrics.gpu.name).set(
-            metrics.gpu.memory_used
-        )
-        self.gpu_memory_free.labels(gpu_id=gpu_id, name=metrics.gpu.name).set(
-            metrics.gpu.memory_free
-        )
-        self.gpu_utilization.labels(gpu_id=gpu_id, name=metrics.gpu.name).set(
-            metrics.gpu.gpu_utilization
-        )
-        self.gpu_memory_utilization.labels(gpu_id=gpu_id, name=metrics.gpu.name).set(
-            metrics.gpu.memory_utilization
-        )
-        self.gpu_fan_speed.labels(gpu_id=gpu_id, name=metrics.gpu.name).set(
-            metrics.gpu.fan_speed
-        )
+        gpu = metrics.gpu
+        for gauge, field in GPU_GAUGE_FIELDS:
+            getattr(self, gauge).labels(gpu_id, gpu.name).set(getattr(gpu, field))
 
     def get_prometheus_metrics(self) -> bytes:
         """Get metrics in Prometheus text format.
@@ -273,7 +333,7 @@ class MetricsCollector:
         Returns:
             bytes: Prometheus formatted metrics.
         """
-        return generate_latest()
+        return generate_latest(self._registry)
 
     async def get_latest_metrics(self) -> str:
         """Get the latest metrics in Prometheus format.
@@ -283,4 +343,4 @@ class MetricsCollector:
         """
         metrics = await self.collect_metrics()
         self.update_prometheus_metrics(metrics)
-        return generate_latest().decode("utf-8")
+        return self.get_prometheus_metrics().decode("utf-8")
@@ -4,35 +4,52 @@ This module provides a simple interface for getting Prometheus metrics.
 The actual collection and formatting is handled by the MetricsCollector class.
 """
 
+from contextlib import suppress
 from typing import Optional
 
+from prometheus_client import (
+    GC_COLLECTOR,
+    PLATFORM_COLLECTOR,
+    PROCESS_COLLECTOR,
+    REGISTRY,
+    CollectorRegistry,
+)
+
 from .collectors import MetricsCollector
 
+# The client's default process/platform/GC collectors read /proc/self and
+# the interpreter on every scrape; only the host metrics are exported
+for _default_collector in (PROCESS_COLLECTOR, PLATFORM_COLLECTOR, GC_COLLECTOR):
+    with suppress(KeyError):
+        REGISTRY.unregister(_default_collector)
 
-class CollectorSingleton:
-    """Singleton class for managing the metrics collector instance."""
+# Shared collector for the global registry, built on first use and rebuilt
+# once closed
+_collector: Optional[MetricsCollector] = None
 
-    _instance: Optional[MetricsCollector] = None
 
-    @classmethod
-    def get_instance(cls) -> MetricsCollector:
-        """Get or create the singleton metrics collector instance.
+def get_collector(registry: Optional[CollectorRegistry] = None) -> MetricsCollector:
+    """Get or create the metrics collector.
 
-        Returns:
-            MetricsCollector: The singleton metrics collector instance.
-        """
-        if cls._instance is None:
-            cls._instance = MetricsCollector()
-        return cls._instance
+    Only the collector for the global registry is cached, and a closed one
+    is replaced by a new collector. A caller passing
+    its own registry gets a new collector on every call and owns it: it
+    should be closed once the registry is no longer needed.
 
-
-def get_collector() -> MetricsCollector:
-    """Get or create the metrics collector.
+    Args:
+        registry: Prometheus registry to export to. Defaults to the global
+            registry.
 
     Returns:
         MetricsCollector: The metrics collector instance.
     """
-    return CollectorSingleton.get_instance()
+    global _collector  # noqa: PLW0603
+
+    if registry is not None and registry is not REGISTRY:
+        return MetricsCollector(registry)
+    if _collector is None or _collector.closed:
+        _collector = MetricsCollector()
+    return _collector
 
 
 async def get_latest_metrics() -> bytes:
@@ -2,12 +2,14 @@
 
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class HealthStatus(BaseModel):
     """Health check response model."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: str = "healthy"
     version: str
     error: Optional[str] = None
@@ -17,6 +19,8 @@ class HealthStatus(BaseModel):
 class ErrorResponse(BaseModel):
     """Error response model."""
 
+    model_config = ConfigDict(frozen=True)
+
     detail: str
 
 
@@ -1,11 +1,13 @@
 """Models for system metrics data."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CPUMetrics(BaseModel):
     """CPU metrics model."""
 
+    model_config = ConfigDict(defer_build=True)
+
     physical_cores: int = Field(
         ...,
         description="Number of physical CPU cores",
@@ -66,6 +68,8 @@ class CPUMetrics(BaseModel):
 class MemoryMetrics(BaseModel):
     """Memory metrics model."""
 
+    model_config = ConfigDict(defer_build=True)
+
     total: int = Field(
         ...,
         description="Total virtual memory in bytes",
@@ -126,6 +130,8 @@ class MemoryMetrics(BaseModel):
 class GPUMetrics(BaseModel):
     """GPU metrics model."""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str = Field(
         ...,
         description="GPU device name",
@@ -1,43 +1,49 @@
 """Tests for the API endpoints."""
 
-from collections.abc import Generator
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
+from prometheus_client.metrics_core import Metric
 from prometheus_client.parser import text_string_to_metric_families
 
 from prod_health_guardian import __version__
-from prod_health_guardian.api.main import app
+from prod_health_guardian.api import main
+from prod_health_guardian.metrics import get_collector
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
 # HTTP Status Codes
 HTTP_200_OK = 200
 HTTP_404_NOT_FOUND = 404
 HTTP_500_INTERNAL_SERVER_ERROR = 500
 
 
-@pytest.fixture
-def client() -> Generator[TestClient, None, None]:
-    """Create a test client for the API.
+@lru_cache(maxsize=8)
+def _parse_prom(text: str) -> tuple[Metric, ...]:
+    """Parse a Prometheus exposition once per distinct payload.
+
+    Args:
+        text: Prometheus text exposition.
 
     Returns:
-        TestClient: FastAPI test client.
+        tuple[Metric, ...]: Parsed metric families.
     """
-    with TestClient(app) as client:
-        yield client
+    return tuple(text_string_to_metric_families(text))
 
 
 @pytest.mark.system
-def test_health_check(client: TestClient) -> None:
+async def test_health_check(client: AsyncClient) -> None:
     """Test the health check endpoint.
 
     Args:
-        client: FastAPI test client.
+        client: Async HTTP client bound to the app.
     """
-    response = client.get("/health")
+    response = await client.get("/health")
     assert response.status_code == HTTP_200_OK
 
     data = response.json()
@@ -48,18 +54,18 @@ def test_health_check(client: TestClient) -> None:
     assert data["system"]["collectors"] == "ready"
 
 
-def test_get_metrics(client: TestClient) -> None:
+async def test_get_metrics(client: AsyncClient) -> None:
     """Test the Prometheus metrics endpoint.
 
     Args:
-        client: FastAPI test client.
+        client: Async HTTP client bound to the app.
     """
-    response = client.get("/metrics")
+    response = await client.get("/metrics")
     assert response.status_code == HTTP_200_OK
     assert response.headers["content-type"] == "text/plain; charset=utf-8"
 
     # Verify that the response can be parsed as Prometheus metrics
-    metrics = list(text_string_to_metric_families(response.text))
+    metrics = _parse_prom(response.text)
     assert len(metrics) > 0
 
     # Check for presence of key metrics
@@ -71,11 +77,11 @@ def test_get_metrics(client: TestClient) -> None:
     assert "memory_swap_total_bytes" in metric_names
 
 
-def test_get_metrics_error(client: TestClient, mocker: "MockerFixture") -> None:
+async def test_get_metrics_error(client: AsyncClient, mocker: "MockerFixture") -> None:
     """Test error handling in the metrics endpoint.
 
     Args:
-        client: FastAPI test client.
+        client: Async HTTP client bound to the app.
         mocker: Pytest mocker fixture.
     """
     # Mock CPU collector to raise an exception
@@ -84,7 +90,7 @@ def test_get_metrics_error(client: TestClient, mocker: "MockerFixture") -> None:
         side_effect=Exception("Test error"),
     )
 
-    response = client.get("/metrics")
+    response = await client.get("/metrics")
     assert response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
     assert response.headers["content-type"] == "application/json"
 
@@ -93,13 +99,13 @@ def test_get_metrics_error(client: TestClient, mocker: "MockerFixture") -> None:
     assert data["detail"] == "Failed to generate Prometheus metrics: Test error"
 
 
-def test_get_json_metrics(client: TestClient) -> None:
+async def test_get_json_metrics(client: AsyncClient) -> None:
     """Test the JSON metrics endpoint.
 
     Args:
-        client: FastAPI test client.
+        client: Async HTTP client bound to the app.
     """
-    response = client.get("/metrics/json")
+    response = await client.get("/metrics/json")
     assert response.status_code == HTTP_200_OK
     assert response.headers["content-type"] == "application/json"
 
@@ -118,11 +124,13 @@ def test_get_json_metrics(client: TestClient) -> None:
     assert "per_cpu_percent" in cpu
 
 
-def test_get_json_metrics_error(client: TestClient, mocker: "MockerFixture") -> None:
+async def test_get_json_metrics_error(
+    client: AsyncClient, mocker: "MockerFixture"
+) -> None:
     """Test error handling in the JSON metrics endpoint.
 
     Args:
-        client: FastAPI test client.
+        client: Async HTTP client bound to the app.
         mocker: Pytest mocker fixture.
     """
     # Mock memory collector to raise an exception
@@ -131,7 +139,7 @@ def test_get_json_metrics_error(client: TestClient, mocker: "MockerFixture") ->
         side_effect=Exception("Test error"),
     )
 
-    response = client.get("/metrics/json")
+    response = await client.get("/metrics/json")
     assert response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
     assert response.headers["content-type"] == "application/json"
 
@@ -141,13 +149,13 @@ def test_get_json_metrics_error(client: TestClient, mocker: "MockerFixture") ->
     assert "Test error" in data["detail"]
 
 
-def test_get_cpu_metrics(client: TestClient) -> None:
+async def test_get_cpu_metrics(client: AsyncClient) -> None:
     """Test getting CPU metrics in JSON format.
 
     Args:
-        client: FastAPI test client.
+        client: Async HTTP client bound to the app.
     """
-    response = client.get("/metrics/json/cpu")
+    response = await client.get("/metrics/json/cpu")
     assert response.status_code == HTTP_200_OK
     assert response.headers["content-type"] == "application/json"
 
@@ -163,13 +171,13 @@ def test_get_cpu_metrics(client: TestClient) -> None:
     assert "per_cpu_percent" in cpu
 
 
-def test_get_memory_metrics(client: TestClient) -> None:
+async def test_get_memory_metrics(client: AsyncClient) -> None:
     """Test getting memory metrics in JSON format.
 
     Args:
-        client: FastAPI test client.
+        client: Async HTTP client bound to the app.
     """
-    response = client.get("/metrics/json/memory")
+    response = await client.get("/metrics/json/memory")
     assert response.status_code == HTTP_200_OK
     assert response.headers["content-type"] == "application/json"
 
@@ -187,14 +195,14 @@ def test_get_memory_metrics(client: TestClient) -> None:
     assert "swap_percent" in memory
 
 
-def test_get_collector_metrics_error(
-    client: TestClient,
+async def test_get_collector_metrics_error(
+    client: AsyncClient,
     mocker: "MockerFixture",
 ) -> None:
     """Test error handling in the collector metrics endpoint.
 
     Args:
-        client: FastAPI test client.
+        client: Async HTTP client bound to the app.
         mocker: Pytest mocker fixture.
     """
     # Mock CPU collector to raise an exception
@@ -203,7 +211,7 @@ def test_get_collector_metrics_error(
         side_effect=Exception("Test error"),
     )
 
-    response = client.get("/metrics/json/cpu")
+    response = await client.get("/metrics/json/cpu")
     assert response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
     assert response.headers["content-type"] == "application/json"
 
@@ -212,15 +220,28 @@ def test_get_collector_metrics_error(
     assert data["detail"] == "Failed to collect metrics from cpu"
 
 
-def test_get_invalid_collector_metrics(client: TestClient) -> None:
+async def test_get_invalid_collector_metrics(client: AsyncClient) -> None:
     """Test getting metrics from an invalid collector.
 
     Args:
-        client: FastAPI test client.
+        client: Async HTTP client bound to the app.
     """
-    response = client.get("/metrics/json/invalid")
+    response = await client.get("/metrics/json/invalid")
     assert response.status_code == HTTP_404_NOT_FOUND
     assert response.headers["content-type"] == "application/json"
 
     data = response.json()
     assert "detail" in data
+
+
+async def test_shutdown_closes_metrics_collector() -> None:
+    """Test app shutdown closes the metrics collector and drops it.
+
+    The next lookup builds a fresh collector instead of the closed one.
+    """
+    async with main.app.router.lifespan_context(main.app):
+        collector = get_collector()
+        assert not collector.closed
+
+    assert collector.closed
+    assert get_collector() is not collector
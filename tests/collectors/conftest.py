@@ -1,15 +1,17 @@
 """Shared fixtures for collector tests."""
 
-from typing import TYPE_CHECKING, Union
+import asyncio
+from collections import namedtuple
+from typing import TYPE_CHECKING, Any
 
 import pytest
+import pytest_asyncio
+
+from prod_health_guardian.collectors import CPUCollector, MemoryCollector
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
-# Type aliases
-CPUMetric = Union[float, list[float]]
-
 # CPU test constants
 CPU_PHYSICAL_CORES = 4
 CPU_LOGICAL_CORES = 8
@@ -23,6 +25,16 @@ CPU_INTERRUPTS = 500
 CPU_SOFT_INTERRUPTS = 200
 CPU_SYSCALLS = 300
 
+# psutil return values keyed by the boolean ``logical`` argument
+_CPU_COUNTS: tuple[int, int] = (CPU_PHYSICAL_CORES, CPU_LOGICAL_CORES)
+
+# CPU times before and after one collection, 100s of CPU time per core
+_SCPUTIMES = namedtuple("scputimes", "user idle")
+_CPU_TIMES_START = _SCPUTIMES(0.0, 0.0)
+_CPU_TIMES_END = _SCPUTIMES(CPU_TOTAL_PERCENT, 100.0 - CPU_TOTAL_PERCENT)
+_PER_CPU_TIMES_START = [_CPU_TIMES_START] * len(CPU_PER_CPU_PERCENT)
+_PER_CPU_TIMES_END = [_SCPUTIMES(p, 100.0 - p) for p in CPU_PER_CPU_PERCENT]
+
 # Memory test constants
 TOTAL_MEMORY = 16_000_000_000  # 16GB
 USED_MEMORY = 8_000_000_000  # 8GB
@@ -35,6 +47,14 @@ SWAP_PERCENT = 12.5
 SWAP_IN = 100
 SWAP_OUT = 50
 
+# Prebuilt psutil results, laid out like psutil's svmem/sswap namedtuples
+_SVMEM = namedtuple("svmem", "total available percent used free")(
+    TOTAL_MEMORY, FREE_MEMORY, MEMORY_PERCENT, USED_MEMORY, FREE_MEMORY
+)
+_SSWAP = namedtuple("sswap", "total used free percent sin sout")(
+    TOTAL_SWAP, USED_SWAP, FREE_SWAP, SWAP_PERCENT, SWAP_IN, SWAP_OUT
+)
+
 # GPU test constants
 GPU_NAME = "NVIDIA GeForce RTX 3080"
 GPU_TEMP = 65.0
@@ -57,22 +77,19 @@ def mock_cpu_psutil(mocker: "MockerFixture") -> "MockerFixture":
     Returns:
         MockerFixture: Configured mocker.
     """
+    mocker.patch("prod_health_guardian.collectors.cpu.PROC_STAT", "/nonexistent")
     mock = mocker.patch("prod_health_guardian.collectors.cpu.psutil")
 
     # Set up mock values
-    mock.cpu_count.side_effect = (
-        lambda logical: CPU_LOGICAL_CORES if logical else CPU_PHYSICAL_CORES
-    )
+    mock.cpu_count.side_effect = lambda logical: _CPU_COUNTS[logical]
     mock.cpu_freq.return_value.current = CPU_FREQ_CURRENT
     mock.cpu_freq.return_value.min = CPU_FREQ_MIN
     mock.cpu_freq.return_value.max = CPU_FREQ_MAX
-    mock.cpu_percent.return_value = CPU_TOTAL_PERCENT
-
-    def cpu_percent_side_effect(interval: float, percpu: bool = False) -> CPUMetric:
-        """Side effect for cpu_percent to handle both total and per-CPU metrics."""
-        return CPU_PER_CPU_PERCENT if percpu else CPU_TOTAL_PERCENT
-
-    mock.cpu_percent.side_effect = cpu_percent_side_effect
+    samples = {
+        False: iter([_CPU_TIMES_START, _CPU_TIMES_END]),
+        True: iter([_PER_CPU_TIMES_START, _PER_CPU_TIMES_END]),
+    }
+    mock.cpu_times.side_effect = lambda percpu=False: next(samples[percpu])
     mock.cpu_stats.return_value.ctx_switches = CPU_CTX_SWITCHES
     mock.cpu_stats.return_value.interrupts = CPU_INTERRUPTS
     mock.cpu_stats.return_value.soft_interrupts = CPU_SOFT_INTERRUPTS
@@ -93,20 +110,9 @@ def mock_memory_psutil(mocker: "MockerFixture") -> "MockerFixture":
     """
     mock = mocker.patch("prod_health_guardian.collectors.memory.psutil")
 
-    # Set up virtual memory mock
-    mock.virtual_memory.return_value.total = TOTAL_MEMORY
-    mock.virtual_memory.return_value.used = USED_MEMORY
-    mock.virtual_memory.return_value.free = FREE_MEMORY
-    mock.virtual_memory.return_value.available = FREE_MEMORY
-    mock.virtual_memory.return_value.percent = MEMORY_PERCENT
-
-    # Set up swap memory mock
-    mock.swap_memory.return_value.total = TOTAL_SWAP
-    mock.swap_memory.return_value.used = USED_SWAP
-    mock.swap_memory.return_value.free = FREE_SWAP
-    mock.swap_memory.return_value.percent = SWAP_PERCENT
-    mock.swap_memory.return_value.sin = SWAP_IN
-    mock.swap_memory.return_value.sout = SWAP_OUT
+    # Set up virtual and swap memory mocks
+    mock.virtual_memory.return_value = _SVMEM
+    mock.swap_memory.return_value = _SSWAP
 
     return mock
 
@@ -146,3 +152,25 @@ def mock_gpu_nvml(mocker: "MockerFixture") -> "MockerFixture":
     mock.nvmlDeviceGetFanSpeed.return_value = GPU_FAN_SPEED
 
     return mock
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def cpu_metrics() -> dict[str, Any]:
+    """Collect real CPU metrics once per module.
+
+    Returns:
+        dict[str, Any]: CPU metrics from the host, sampled over 0.1s.
+    """
+    collector = CPUCollector(interval=0.1)
+    await asyncio.sleep(collector.interval)
+    return await collector.collect()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def memory_metrics() -> dict[str, Any]:
+    """Collect real memory metrics once per module.
+
+    Returns:
+        dict[str, Any]: Memory metrics from the host.
+    """
+    return await MemoryCollector().collect()
@@ -5,7 +5,9 @@ the base collector. Detailed tests for each collector are in the
 collectors/ directory.
 """
 
-from typing import TYPE_CHECKING
+from collections import deque
+from collections.abc import Sequence
+from typing import Any
 
 import pytest
 
@@ -16,8 +18,47 @@ from prod_health_guardian.collectors import (
     MemoryCollector,
 )
 
-if TYPE_CHECKING:
-    pass
+# Leaf types a collector may report, checked by _validate_scalars
+_SCALARS = (int, float, str, bool, type(None))
+
+# Bounds for every percentage a collector reports
+MIN_PERCENT = 0.0
+MAX_PERCENT = 100.0
+
+
+def _in_range(values: Sequence[float], lo: float, hi: float) -> bool:
+    """Check all values lie in [lo, hi] with one min and one max reduction.
+
+    Args:
+        values: Values to check.
+        lo: Inclusive lower bound.
+        hi: Inclusive upper bound.
+
+    Returns:
+        bool: True if every value is within the bounds.
+    """
+    return not (min(values) < lo or max(values) > hi)
+
+
+def _validate_scalars(root: dict[str, Any]) -> None:
+    """Assert a metrics dict holds only string keys and scalar leaves.
+
+    Nested dicts and lists are walked with an explicit stack.
+
+    Args:
+        root: Metrics dictionary returned by a collector.
+    """
+    stack: deque[Any] = deque([root])
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            assert all(isinstance(key, str) for key in node)
+            node = node.values()
+        for value in node:
+            if isinstance(value, (dict, list)):
+                stack.append(value)
+            else:
+                assert isinstance(value, _SCALARS), value
 
 
 class TestCollector(BaseCollector):
@@ -42,7 +83,6 @@ class TestCollector(BaseCollector):
         return {"test_value": 42}
 
 
-@pytest.mark.asyncio
 async def test_base_collector() -> None:
     """Test base collector functionality."""
     collector = TestCollector()
@@ -54,24 +94,60 @@ async def test_base_collector() -> None:
 
 
 @pytest.mark.collectors
-@pytest.mark.asyncio
-async def test_collector_integration() -> None:
+@pytest.mark.parametrize(
+    ("collector_cls", "name"),
+    [(CPUCollector, "cpu"), (MemoryCollector, "memory"), (GPUCollector, "gpu")],
+)
+def test_collector_identity(collector_cls: type[BaseCollector], name: str) -> None:
+    """Test each collector reports its name and availability.
+
+    Args:
+        collector_cls: Collector class under test.
+        name: Expected collector name.
+    """
+    collector = collector_cls()
+    assert collector.get_name() == name
+    assert isinstance(collector.is_available, bool)
+
+
+@pytest.mark.slow
+@pytest.mark.collectors
+def test_collector_integration(
+    cpu_metrics: dict[str, Any],
+    memory_metrics: dict[str, Any],
+) -> None:
     """Integration test for all collectors working together.
 
-    This test ensures that all collectors can be instantiated and used together,
-    which is important for the metrics collection system as a whole.
+    This test ensures that all collectors can be used together, which is
+    important for the metrics collection system as a whole. The metrics are
+    collected once per module by the conftest fixtures. The real GPU is
+    checked separately by test_gpu_collector_host, skipped without NVML.
+
+    Args:
+        cpu_metrics: Real CPU metrics.
+        memory_metrics: Real memory metrics.
     """
-    # Test all collectors can be instantiated and collect metrics
-    collectors = [
-        CPUCollector(),
-        MemoryCollector(),
-        GPUCollector(),
-    ]
-
-    for collector in collectors:
-        metrics = await collector.collect()
+    for metrics in (cpu_metrics, memory_metrics):
         assert isinstance(metrics, dict)
-        assert all(isinstance(key, str) for key in metrics.keys())
-        assert all(
-            isinstance(value, (int, float, str, list)) for value in metrics.values()
-        )
+        _validate_scalars(metrics)
+
+    cpu_percents = [cpu_metrics["cpu_percent"], *cpu_metrics["per_cpu_percent"]]
+    assert _in_range(cpu_percents, MIN_PERCENT, MAX_PERCENT), cpu_percents
+    memory_percents = [memory_metrics["percent"], memory_metrics["swap_percent"]]
+    assert _in_range(memory_percents, MIN_PERCENT, MAX_PERCENT), memory_percents
+
+
+@pytest.mark.slow
+@pytest.mark.collectors
+async def test_gpu_collector_host(gpu_collector: GPUCollector) -> None:
+    """Test GPU collector against the host's NVML, where one is present.
+
+    Args:
+        gpu_collector: Session-wide real GPU collector.
+    """
+    if gpu_collector.handle is None:
+        pytest.skip("No NVIDIA GPU available through NVML on this host")
+
+    metrics = await gpu_collector.collect()
+    assert all(isinstance(value, (int, float, str)) for value in metrics.values())
+    assert metrics["memory_total"] > 0
@@ -2,6 +2,7 @@
 
 from typing import TYPE_CHECKING
 
+import psutil
 import pytest
 
 from prod_health_guardian.collectors.cpu import CPUCollector
@@ -20,10 +21,34 @@ from tests.collectors.conftest import (
 )
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from pytest_mock import MockerFixture
 
+pytestmark = pytest.mark.collectors
+
+# /proc/stat before and after one collection: 200 ticks per CPU, 25.5% busy
+# in total and 20%/30% busy on the two cores
+PROC_STAT_START = """\
+cpu  0 0 0 0 0 0 0 0 0 0
+cpu0 0 0 0 0 0 0 0 0 0 0
+cpu1 0 0 0 0 0 0 0 0 0 0
+intr 0 0 0
+ctxt 0
+btime 1700000000
+softirq 0 0 0
+"""
+PROC_STAT_END = f"""\
+cpu  80 1 21 292 6 0 0 0 0 0
+cpu0 30 0 10 156 4 0 0 0 0 0
+cpu1 50 1 9 138 2 0 0 0 0 0
+intr {CPU_INTERRUPTS} 10 20
+ctxt {CPU_CTX_SWITCHES}
+btime 1700000000
+softirq {CPU_SOFT_INTERRUPTS} 5 5
+"""
+
 
-@pytest.mark.asyncio
 async def test_cpu_collector_init() -> None:
     """Test CPU collector initialization."""
     collector = CPUCollector()
@@ -31,7 +56,6 @@ async def test_cpu_collector_init() -> None:
     assert collector.interval == 1.0
 
 
-@pytest.mark.asyncio
 async def test_cpu_collector_metrics(mock_cpu_psutil: "MockerFixture") -> None:
     """Test CPU collector metrics collection.
 
@@ -66,7 +90,6 @@ async def test_cpu_collector_metrics(mock_cpu_psutil: "MockerFixture") -> None:
     assert metrics["syscalls"] == CPU_SYSCALLS
 
 
-@pytest.mark.asyncio
 async def test_cpu_collector_no_frequency(mock_cpu_psutil: "MockerFixture") -> None:
     """Test CPU collector when frequency information is not available.
 
@@ -88,3 +111,70 @@ async def test_cpu_collector_no_frequency(mock_cpu_psutil: "MockerFixture") -> N
     assert metrics["physical_cores"] == CPU_PHYSICAL_CORES
     assert metrics["logical_cores"] == CPU_LOGICAL_CORES
     assert metrics["cpu_percent"] == CPU_TOTAL_PERCENT
+
+
+async def test_cpu_collector_no_elapsed_time(mock_cpu_psutil: "MockerFixture") -> None:
+    """Test the previous reading is kept when no CPU time elapsed.
+
+    Args:
+        mock_cpu_psutil: Mocked psutil fixture.
+    """
+    collector = CPUCollector()
+    await collector.collect()
+
+    # The next collection lands within the same clock tick
+    stat = collector._stat
+    mock_cpu_psutil.cpu_times.side_effect = lambda percpu=False: (
+        stat["per_cpu_times"] if percpu else stat["times"]
+    )
+    metrics = await collector.collect()
+
+    assert metrics["cpu_percent"] == CPU_TOTAL_PERCENT
+    assert metrics["per_cpu_percent"] == CPU_PER_CPU_PERCENT
+
+
+async def test_cpu_collector_first_sample_no_elapsed_time(
+    mock_cpu_psutil: "MockerFixture",
+) -> None:
+    """Test usage is 0.0 when the very first sample has no elapsed time.
+
+    Args:
+        mock_cpu_psutil: Mocked psutil fixture.
+    """
+    snapshot = psutil.cpu_times()
+    mock_cpu_psutil.cpu_times.side_effect = lambda percpu=False: (
+        [snapshot] if percpu else snapshot
+    )
+
+    collector = CPUCollector()
+    metrics = await collector.collect()
+
+    assert metrics["cpu_percent"] == 0.0
+    assert metrics["per_cpu_percent"] == [0.0]
+
+
+async def test_cpu_collector_proc_stat(
+    mock_cpu_psutil: "MockerFixture", mocker: "MockerFixture", tmp_path: "Path"
+) -> None:
+    """Test CPU usage and stats parsed from a single /proc/stat read.
+
+    Args:
+        mock_cpu_psutil: Mocked psutil fixture.
+        mocker: Pytest mocker fixture.
+        tmp_path: Temporary directory holding the fake /proc/stat.
+    """
+    proc_stat = tmp_path / "stat"
+    mocker.patch("prod_health_guardian.collectors.cpu.PROC_STAT", str(proc_stat))
+    proc_stat.write_text(PROC_STAT_START)
+    collector = CPUCollector()
+    proc_stat.write_text(PROC_STAT_END)
+    metrics = await collector.collect()
+
+    assert metrics["cpu_percent"] == CPU_TOTAL_PERCENT
+    assert metrics["per_cpu_percent"] == CPU_PER_CPU_PERCENT[:2]
+    assert metrics["ctx_switches"] == CPU_CTX_SWITCHES
+    assert metrics["interrupts"] == CPU_INTERRUPTS
+    assert metrics["soft_interrupts"] == CPU_SOFT_INTERRUPTS
+    assert metrics["syscalls"] == 0
+    mock_cpu_psutil.cpu_times.assert_not_called()
+    mock_cpu_psutil.cpu_stats.assert_not_called()
@@ -1,15 +1,23 @@
 """Test GPU collector functionality."""
 
+import sys
+import threading
 from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 
 import pynvml
 import pytest
 
-from prod_health_guardian.collectors.gpu import GPUCollector
+from prod_health_guardian.collectors import gpu
+from prod_health_guardian.collectors.gpu import GPUCollector, _nvidia_driver_present
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from pytest_mock.plugin import MockerFixture
 
+pytestmark = pytest.mark.collectors
+
 # Test constants
 GPU_NAME = "NVIDIA Test GPU"
 GPU_TEMP = 65.0
@@ -20,37 +28,70 @@ GPU_MEM_FREE = 4294967296  # 4GB
 GPU_UTIL = 75.0
 GPU_MEM_UTIL = 50.0
 GPU_FAN = 80.0
+COLLECTIONS = 3
+
+
+@pytest.fixture(scope="module")
+def nvml_patches(module_mocker: "MockerFixture") -> tuple[MagicMock, MagicMock]:
+    """Patch NVML, the driver probe and the poller thread once per module.
+
+    Autospeccing the pynvml module is the expensive part of the setup, so
+    it is done once and the mocks are reset per test by mock_gpu_nvml.
+
+    Args:
+        module_mocker: Module-scoped pytest mocker fixture.
+
+    Returns:
+        tuple[MagicMock, MagicMock]: Mocked pynvml module and Thread class.
+    """
+    module_mocker.patch(
+        "prod_health_guardian.collectors.gpu._nvidia_driver_present",
+        return_value=True,
+    )
+    # Keep polling on the test thread: tests drive _poll_once() themselves.
+    # Only gpu.py's threading reference is replaced; threading.Thread
+    # stays real for the rest of the process.
+    stub = MagicMock(spec=threading, Event=threading.Event)
+    module_mocker.patch.object(gpu, "threading", stub)
+    thread = stub.Thread
+    nvml = module_mocker.patch(
+        "prod_health_guardian.collectors.gpu.pynvml", autospec=True
+    )
+    # Autospec turns classes into mocks; except clauses need the real one
+    nvml.NVMLError = pynvml.NVMLError
+    return nvml, thread
 
 
 @pytest.fixture
-def mock_gpu_nvml(mocker: "MockerFixture") -> "MockerFixture":
-    """Set up GPU NVML mocks.
+def mock_gpu_nvml(nvml_patches: tuple[MagicMock, MagicMock]) -> MagicMock:
+    """Reset the shared NVML mocks and configure a healthy GPU.
 
     Args:
-        mocker: Pytest mocker fixture.
+        nvml_patches: Module-wide NVML and Thread mocks.
 
     Returns:
-        MockerFixture: Mocked NVML module.
+        MagicMock: Mocked NVML module.
     """
-    mock = mocker.patch("prod_health_guardian.collectors.gpu.pynvml", autospec=True)
+    mock, thread = nvml_patches
+    mock.reset_mock(return_value=True, side_effect=True)
+    thread.reset_mock()
+
     mock.nvmlInit.return_value = None
     mock.nvmlDeviceGetCount.return_value = 1
-
-    mock_handle = mocker.MagicMock()
-    mock.nvmlDeviceGetHandleByIndex.return_value = mock_handle
+    mock.nvmlDeviceGetHandleByIndex.return_value = MagicMock()
 
     mock.nvmlDeviceGetName.return_value = GPU_NAME.encode()
     mock.nvmlDeviceGetTemperature.return_value = GPU_TEMP
     # Convert watts to milliwatts for NVML
     mock.nvmlDeviceGetPowerUsage.return_value = GPU_POWER * 1000
 
-    mock_memory = mocker.MagicMock()
+    mock_memory = MagicMock()
     mock_memory.total = GPU_MEM_TOTAL
     mock_memory.used = GPU_MEM_USED
     mock_memory.free = GPU_MEM_FREE
     mock.nvmlDeviceGetMemoryInfo.return_value = mock_memory
 
-    mock_util = mocker.MagicMock()
+    mock_util = MagicMock()
     mock_util.gpu = GPU_UTIL
     mock_util.memory = GPU_MEM_UTIL
     mock.nvmlDeviceGetUtilizationRates.return_value = mock_util
@@ -60,8 +101,7 @@ def mock_gpu_nvml(mocker: "MockerFixture") -> "MockerFixture":
     return mock
 
 
-@pytest.mark.asyncio
-async def test_gpu_collector_metrics(mock_gpu_nvml: "MockerFixture") -> None:
+async def test_gpu_collector_metrics(mock_gpu_nvml: MagicMock) -> None:
     """Test GPU collector metrics collection.
 
     Args:
@@ -87,8 +127,82 @@ async def test_gpu_collector_metrics(mock_gpu_nvml: "MockerFixture") -> None:
     assert metrics["fan_speed"] == GPU_FAN
 
 
-@pytest.mark.asyncio
-async def test_gpu_collector_no_gpu(mock_gpu_nvml: "MockerFixture") -> None:
+async def test_gpu_collector_reuses_device_lookups(
+    mock_gpu_nvml: MagicMock,
+) -> None:
+    """Test the device handle and name are looked up once across polls.
+
+    Args:
+        mock_gpu_nvml: Mocked NVML fixture.
+    """
+    collector = GPUCollector()
+    for _ in range(COLLECTIONS - 1):
+        collector._poll_once()
+
+    assert mock_gpu_nvml.nvmlDeviceGetHandleByIndex.call_count == 1
+    assert mock_gpu_nvml.nvmlDeviceGetName.call_count == 1
+    assert mock_gpu_nvml.nvmlDeviceGetTemperature.call_count == COLLECTIONS
+
+
+async def test_gpu_collector_serves_snapshot(mock_gpu_nvml: MagicMock) -> None:
+    """Test collect() serves the last polled snapshot without calling NVML.
+
+    Args:
+        mock_gpu_nvml: Mocked NVML fixture.
+    """
+    collector = GPUCollector()
+    first = await collector.collect()
+    mock_gpu_nvml.nvmlDeviceGetTemperature.return_value = GPU_TEMP + 1
+
+    assert await collector.collect() == first
+    assert mock_gpu_nvml.nvmlDeviceGetTemperature.call_count == 1
+
+    collector._poll_once()
+    metrics = await collector.collect()
+    assert metrics["temperature"] == GPU_TEMP + 1
+
+
+def test_gpu_collector_close(mock_gpu_nvml: MagicMock) -> None:
+    """Test close() stops the poller and shuts down NVML once.
+
+    Args:
+        mock_gpu_nvml: Mocked NVML fixture.
+    """
+    collector = GPUCollector()
+    collector._poller.start.assert_called_once()
+    # Only gpu.py sees the mocked Thread; the process keeps the real one
+    assert not isinstance(threading.Thread, MagicMock)
+
+    collector.close()
+    collector._poller.join.assert_called_once()
+    mock_gpu_nvml.nvmlShutdown.assert_called_once()
+
+    # Closing again is a no-op
+    collector.close()
+    mock_gpu_nvml.nvmlShutdown.assert_called_once()
+
+    # A stopped loop exits without touching NVML
+    collector._poll_loop()
+    assert mock_gpu_nvml.nvmlDeviceGetTemperature.call_count == 1
+
+
+async def test_gpu_collector_collect_after_close(mock_gpu_nvml: MagicMock) -> None:
+    """Test collect() stops serving the last reading once closed.
+
+    Args:
+        mock_gpu_nvml: Mocked NVML fixture.
+    """
+    collector = GPUCollector()
+    assert (await collector.collect())["name"] == GPU_NAME
+
+    collector.close()
+    metrics = await collector.collect()
+
+    assert metrics["name"] == "No GPU"
+    assert metrics["temperature"] == 0.0
+
+
+async def test_gpu_collector_no_gpu(mock_gpu_nvml: MagicMock) -> None:
     """Test GPU collector when no GPU is available.
 
     Args:
@@ -112,8 +226,138 @@ async def test_gpu_collector_no_gpu(mock_gpu_nvml: "MockerFixture") -> None:
     assert metrics["fan_speed"] == 0.0
 
 
-@pytest.mark.asyncio
-async def test_gpu_collector_no_power(mock_gpu_nvml: "MockerFixture") -> None:
+async def test_gpu_collector_nvml_error(
+    mock_gpu_nvml: MagicMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an NVML error abandons the reading after the failing query.
+
+    Args:
+        mock_gpu_nvml: Mocked NVML fixture.
+        caplog: Pytest log capture fixture.
+    """
+    mock_gpu_nvml.nvmlDeviceGetTemperature.side_effect = pynvml.NVMLError_Unknown()
+
+    collector = GPUCollector()
+    metrics = await collector.collect()
+
+    assert metrics["name"] == "Error"
+    assert metrics["temperature"] == 0.0
+    mock_gpu_nvml.nvmlDeviceGetTemperature.assert_called_once()
+    mock_gpu_nvml.nvmlDeviceGetMemoryInfo.assert_not_called()
+    assert "Error collecting GPU metrics" in caplog.text
+
+
+async def test_gpu_collector_str_name(mock_gpu_nvml: MagicMock) -> None:
+    """Test the device name is accepted as str, as current pynvml returns it.
+
+    Args:
+        mock_gpu_nvml: Mocked NVML fixture.
+    """
+    mock_gpu_nvml.nvmlDeviceGetName.return_value = GPU_NAME
+
+    collector = GPUCollector()
+    metrics = await collector.collect()
+
+    assert metrics["name"] == GPU_NAME
+    assert metrics["temperature"] == GPU_TEMP
+
+
+async def test_gpu_collector_unexpected_error(
+    mock_gpu_nvml: MagicMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a non-NVML error neither breaks construction nor stops the poller.
+
+    Args:
+        mock_gpu_nvml: Mocked NVML fixture.
+        caplog: Pytest log capture fixture.
+    """
+    mock_gpu_nvml.nvmlDeviceGetTemperature.side_effect = RuntimeError("boom")
+
+    collector = GPUCollector(interval=0)
+    metrics = await collector.collect()
+
+    assert metrics["name"] == "Error"
+    assert "Unexpected error polling GPU metrics" in caplog.text
+
+    polls = iter([RuntimeError("boom"), GPU_TEMP])
+
+    def read_temperature(*_: object) -> float:
+        reading = next(polls)
+        if isinstance(reading, Exception):
+            raise reading
+        # Stop the loop after this poll
+        collector._stop.set()
+        return reading
+
+    # The loop survives the error and picks up the next good reading
+    mock_gpu_nvml.nvmlDeviceGetTemperature.side_effect = read_temperature
+    collector._poll_loop()
+    metrics = await collector.collect()
+
+    assert metrics["name"] == GPU_NAME
+    assert metrics["temperature"] == GPU_TEMP
+
+
+async def test_gpu_collector_no_driver(
+    mock_gpu_nvml: MagicMock, mocker: "MockerFixture"
+) -> None:
+    """Test NVML is never initialized when the driver probe finds nothing.
+
+    Args:
+        mock_gpu_nvml: Mocked NVML fixture.
+        mocker: Pytest mocker fixture.
+    """
+    mocker.patch(
+        "prod_health_guardian.collectors.gpu._nvidia_driver_present",
+        return_value=False,
+    )
+
+    collector = GPUCollector()
+    metrics = await collector.collect()
+
+    mock_gpu_nvml.nvmlInit.assert_not_called()
+    assert collector.has_nvidia is False
+    assert metrics["name"] == "No GPU"
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Linux driver probe")
+@pytest.mark.parametrize(
+    ("proc_dir", "wsl_device", "expected"),
+    [
+        (True, False, True),
+        (False, True, True),
+        (False, False, False),
+    ],
+    ids=["native", "wsl2", "none"],
+)
+def test_nvidia_driver_present(
+    mocker: "MockerFixture",
+    tmp_path: "Path",
+    proc_dir: bool,
+    wsl_device: bool,
+    expected: bool,
+) -> None:
+    """Test the driver probe on native Linux and WSL2 hosts.
+
+    Args:
+        mocker: Pytest mocker fixture.
+        tmp_path: Temporary directory standing in for /proc and /dev.
+        proc_dir: Whether the NVIDIA procfs directory exists.
+        wsl_device: Whether the WSL2 GPU device exists.
+        expected: Expected probe result.
+    """
+    nvidia_dir, dxg = tmp_path / "nvidia", tmp_path / "dxg"
+    if proc_dir:
+        nvidia_dir.mkdir()
+    if wsl_device:
+        dxg.touch()
+    mocker.patch.object(gpu, "NVIDIA_PROC_DIR", str(nvidia_dir))
+    mocker.patch.object(gpu, "WSL_GPU_DEVICE", str(dxg))
+
+    assert _nvidia_driver_present() is expected
+
+
+async def test_gpu_collector_no_power(mock_gpu_nvml: MagicMock) -> None:
     """Test GPU collector when power information is not available.
 
     Args:
@@ -21,8 +21,9 @@ from tests.collectors.conftest import (
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
+pytestmark = pytest.mark.collectors
+
 
-@pytest.mark.asyncio
 async def test_memory_collector_init() -> None:
     """Test memory collector initialization."""
     collector = MemoryCollector()
@@ -30,7 +31,6 @@ async def test_memory_collector_init() -> None:
     assert collector.interval == 1.0
 
 
-@pytest.mark.asyncio
 async def test_memory_collector_metrics(mock_memory_psutil: "MockerFixture") -> None:
     """Test memory collector metrics collection.
 
@@ -61,7 +61,6 @@ async def test_memory_collector_metrics(mock_memory_psutil: "MockerFixture") ->
     assert metrics["swap_out"] == SWAP_OUT
 
 
-@pytest.mark.asyncio
 async def test_memory_collector_no_swap(mock_memory_psutil: "MockerFixture") -> None:
     """Test memory collector when swap memory is not available.
 
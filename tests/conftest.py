@@ -1,28 +1,103 @@
 """Common test fixtures and configuration."""
 
-from collections.abc import AsyncGenerator
-from typing import TYPE_CHECKING
+import asyncio
+from collections.abc import AsyncGenerator, Callable, Generator, Mapping
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock
 
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
 from prod_health_guardian.api.main import app
+from prod_health_guardian.collectors import GPUCollector
+from prod_health_guardian.metrics.collectors import MetricsCollector
 
 if TYPE_CHECKING:
-    pass
+    from pytest_mock import MockerFixture
+
+try:
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None
+
+# Type aliases
+Payload = Mapping[str, Any]
+PatchCollector = Callable[
+    [MetricsCollector, Payload, Payload, Payload], MetricsCollector
+]
 
 # Test constants
 MEMORY_VIRTUAL_TOTAL = 16_000_000_000  # 16GB
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    """Create an async HTTP client for the API, shared by the whole session.
+
+    Requests go straight to the app through ASGITransport on the session
+    event loop. ASGITransport does not send lifespan events; endpoints look
+    up the shared metrics collector on each request instead.
+
+    Yields:
+        AsyncClient: HTTP client bound to the FastAPI app.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests on uvloop where it is available.
+
+    Returns:
+        asyncio.AbstractEventLoopPolicy: uvloop policy, or the default one
+            on platforms without uvloop (e.g. Windows).
+    """
+    if uvloop is None:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def gpu_collector() -> Generator[GPUCollector, None, None]:
+    """Create one real GPU collector, so NVML is initialized once per session.
+
+    Yields:
+        GPUCollector: GPU collector bound to the host's NVML, if any.
+    """
+    collector = GPUCollector()
+    yield collector
+    collector.close()
+
+
 @pytest.fixture
-def client() -> TestClient:
-    """Create a test client for the API.
+def patched_collector(mocker: "MockerFixture") -> PatchCollector:
+    """Patch a MetricsCollector's hardware collectors to return fixed payloads.
+
+    Args:
+        mocker: Pytest mocker fixture.
 
     Returns:
-        TestClient: FastAPI test client.
+        PatchCollector: Function taking a collector and its CPU, memory and
+            GPU payloads, and returning the patched collector.
     """
-    return TestClient(app)
+
+    def patch(
+        collector: MetricsCollector, cpu: Payload, memory: Payload, gpu: Payload
+    ) -> MetricsCollector:
+        for hardware, payload in (
+            (collector.cpu_collector, cpu),
+            (collector.memory_collector, memory),
+            (collector.gpu_collector, gpu),
+        ):
+            mocker.patch.object(
+                hardware, "collect", new=AsyncMock(return_value=payload)
+            )
+        return collector
+
+    return patch
 
 
 @pytest.fixture
@@ -0,0 +1,126 @@
+"""Shared fixtures for metrics tests."""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+# Test constants
+CPU_PHYSICAL_COUNT = 4
+CPU_LOGICAL_COUNT = 8
+CPU_FREQ_CURRENT = 2400.0
+CPU_FREQ_MIN = 2200.0
+CPU_FREQ_MAX = 3200.0
+CPU_PERCENT_TOTAL = 25.5
+CPU_PERCENT_PER_CPU = [20.0, 30.0, 25.0, 27.0]
+CPU_CTX_SWITCHES = 1000
+CPU_INTERRUPTS = 500
+CPU_SOFT_INTERRUPTS = 200
+CPU_SYSCALLS = 300
+
+# Memory test constants
+MEM_VIRTUAL_TOTAL = 16_000_000_000
+MEM_VIRTUAL_AVAILABLE = 8_000_000_000
+MEM_VIRTUAL_USED = 8_000_000_000
+MEM_VIRTUAL_FREE = 8_000_000_000
+MEM_VIRTUAL_PERCENT = 50.0
+MEM_SWAP_TOTAL = 8_000_000_000
+MEM_SWAP_USED = 1_000_000_000
+MEM_SWAP_FREE = 7_000_000_000
+MEM_SWAP_PERCENT = 12.5
+MEM_SWAP_SIN = 100
+MEM_SWAP_SOUT = 50
+
+# GPU test constants
+GPU_NAME = "NVIDIA GeForce RTX 3080"
+GPU_TEMP = 65.0
+GPU_POWER = 220.5
+GPU_MEMORY_TOTAL = 10_737_418_240
+GPU_MEMORY_USED = 4_294_967_296
+GPU_MEMORY_FREE = 6_442_450_944
+GPU_UTIL = 85.5
+GPU_MEM_UTIL = 40.0
+GPU_FAN = 75.0
+
+
+@pytest.fixture
+def registry() -> CollectorRegistry:
+    """Create an isolated Prometheus registry for a single test.
+
+    Returns:
+        CollectorRegistry: Empty registry, so metrics registered by one test
+            never collide with those of another or with the global registry.
+    """
+    return CollectorRegistry()
+
+
+@pytest.fixture(scope="session")
+def mock_cpu_data() -> Mapping[str, Any]:
+    """Raw CPU collector output.
+
+    Returns:
+        Mapping[str, Any]: Read-only CPU metrics data.
+    """
+    return MappingProxyType(
+        {
+            "physical_cores": CPU_PHYSICAL_COUNT,
+            "logical_cores": CPU_LOGICAL_COUNT,
+            "cpu_freq_current": CPU_FREQ_CURRENT,
+            "cpu_freq_min": CPU_FREQ_MIN,
+            "cpu_freq_max": CPU_FREQ_MAX,
+            "cpu_percent": CPU_PERCENT_TOTAL,
+            "per_cpu_percent": CPU_PERCENT_PER_CPU,
+            "ctx_switches": CPU_CTX_SWITCHES,
+            "interrupts": CPU_INTERRUPTS,
+            "soft_interrupts": CPU_SOFT_INTERRUPTS,
+            "syscalls": CPU_SYSCALLS,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_memory_data() -> Mapping[str, Any]:
+    """Raw memory collector output.
+
+    Returns:
+        Mapping[str, Any]: Read-only memory metrics data.
+    """
+    return MappingProxyType(
+        {
+            "total": MEM_VIRTUAL_TOTAL,
+            "available": MEM_VIRTUAL_AVAILABLE,
+            "used": MEM_VIRTUAL_USED,
+            "free": MEM_VIRTUAL_FREE,
+            "percent": MEM_VIRTUAL_PERCENT,
+            "swap_total": MEM_SWAP_TOTAL,
+            "swap_used": MEM_SWAP_USED,
+            "swap_free": MEM_SWAP_FREE,
+            "swap_percent": MEM_SWAP_PERCENT,
+            "swap_in": MEM_SWAP_SIN,
+            "swap_out": MEM_SWAP_SOUT,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_gpu_data() -> Mapping[str, Any]:
+    """Raw GPU collector output.
+
+    Returns:
+        Mapping[str, Any]: Read-only GPU metrics data.
+    """
+    return MappingProxyType(
+        {
+            "name": GPU_NAME,
+            "temperature": GPU_TEMP,
+            "power_watts": GPU_POWER,
+            "memory_total": GPU_MEMORY_TOTAL,
+            "memory_used": GPU_MEMORY_USED,
+            "memory_free": GPU_MEMORY_FREE,
+            "gpu_utilization": GPU_UTIL,
+            "memory_utilization": GPU_MEM_UTIL,
+            "fan_speed": GPU_FAN,
+        }
+    )
@@ -1,157 +1,151 @@
 """Tests for the metrics collector module."""
 
-from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock
+import re
+from collections.abc import Mapping
+from typing import Any
 
 import pytest
-from prometheus_client import REGISTRY
+from prometheus_client import CollectorRegistry, Gauge
+from prometheus_client.parser import text_string_to_metric_families
 from pytest_mock import MockerFixture
 
-from prod_health_guardian.metrics.collectors import MetricsCollector
+from prod_health_guardian.metrics.collectors import GPU_GAUGE_FIELDS, MetricsCollector
 from prod_health_guardian.models.metrics import (
     CPUMetrics,
     GPUMetrics,
     MemoryMetrics,
     SystemMetrics,
 )
+from tests.conftest import PatchCollector
+from tests.metrics.conftest import (
+    CPU_CTX_SWITCHES,
+    CPU_FREQ_CURRENT,
+    CPU_FREQ_MAX,
+    CPU_FREQ_MIN,
+    CPU_INTERRUPTS,
+    CPU_LOGICAL_COUNT,
+    CPU_PERCENT_PER_CPU,
+    CPU_PERCENT_TOTAL,
+    CPU_PHYSICAL_COUNT,
+    CPU_SOFT_INTERRUPTS,
+    CPU_SYSCALLS,
+    GPU_NAME,
+    GPU_POWER,
+    GPU_TEMP,
+    MEM_SWAP_TOTAL,
+    MEM_VIRTUAL_TOTAL,
+)
+
+# Type aliases
+SampleKey = tuple[str, tuple[tuple[str, str], ...]]
 
-if TYPE_CHECKING:
-    from pytest_mock.plugin import MockerFixture
-
-
-@pytest.fixture(autouse=True)
-def clear_registry() -> None:
-    """Clear the Prometheus registry before each test."""
-    collectors = list(REGISTRY._collector_to_names.keys())
-    for collector in collectors:
-        REGISTRY.unregister(collector)
-
-
-# Test constants
-CPU_PHYSICAL_COUNT = 4
-CPU_LOGICAL_COUNT = 8
-CPU_FREQ_CURRENT = 2400.0
-CPU_FREQ_MIN = 2200.0
-CPU_FREQ_MAX = 3200.0
-CPU_PERCENT_TOTAL = 25.5
-CPU_PERCENT_PER_CPU = [20.0, 30.0, 25.0, 27.0]
-CPU_CTX_SWITCHES = 1000
-CPU_INTERRUPTS = 500
-CPU_SOFT_INTERRUPTS = 200
-CPU_SYSCALLS = 300
-
-# Memory test constants
-MEM_VIRTUAL_TOTAL = 16_000_000_000
-MEM_VIRTUAL_AVAILABLE = 8_000_000_000
-MEM_VIRTUAL_USED = 8_000_000_000
-MEM_VIRTUAL_FREE = 8_000_000_000
-MEM_VIRTUAL_PERCENT = 50.0
-MEM_SWAP_TOTAL = 8_000_000_000
-MEM_SWAP_USED = 1_000_000_000
-MEM_SWAP_FREE = 7_000_000_000
-MEM_SWAP_PERCENT = 12.5
-MEM_SWAP_SIN = 100
-MEM_SWAP_SOUT = 50
-
-# GPU test constants
-GPU_DEVICE_COUNT = 2
-GPU_NAME = "NVIDIA GeForce RTX 3080"
-GPU_TEMP_1 = 65.0
-GPU_TEMP_2 = 67.0
-GPU_POWER_1 = 220.5
-GPU_POWER_2 = 225.5
-GPU_MEMORY_TOTAL = 10_737_418_240
-GPU_MEMORY_USED_1 = 4_294_967_296
-GPU_MEMORY_USED_2 = 5_368_709_120
-GPU_MEMORY_FREE_1 = 6_442_450_944
-GPU_MEMORY_FREE_2 = 5_368_709_120
-GPU_UTIL_1 = 85.5
-GPU_UTIL_2 = 90.5
-GPU_MEM_UTIL_1 = 40.0
-GPU_MEM_UTIL_2 = 50.0
-GPU_FAN_1 = 75.0
-GPU_FAN_2 = 80.0
+# Exposition lines, matched against the raw bytes returned by the registry
+_MEM_VIRT_RE = re.compile(rb"memory_virtual_total_bytes\s+([\d.e+-]+)")
+_MEM_SWAP_RE = re.compile(rb"memory_swap_total_bytes\s+([\d.e+-]+)")
+_GPU_LABELS = re.escape(f'{{gpu_id="0",name="{GPU_NAME}"}}'.encode())
+_GPU_TEMP_RE = re.compile(
+    rb"gpu_temperature_celsius" + _GPU_LABELS + rb"\s+([\d.e+-]+)"
+)
+_GPU_POWER_RE = re.compile(rb"gpu_power_watts" + _GPU_LABELS + rb"\s+([\d.e+-]+)")
 
+# Gauges with labels, which are reset by dropping their children
+LABELLED_GAUGES = ("cpu_percent_per_cpu", *(gauge for gauge, _ in GPU_GAUGE_FIELDS))
 
-@pytest.fixture
-def mock_collectors(mocker: MockerFixture) -> None:
-    """Mock hardware collectors.
+
+def snapshot(registry: CollectorRegistry) -> dict[SampleKey, float]:
+    """Read every sample in a registry in a single pass.
 
     Args:
-        mocker: Pytest mocker fixture.
+        registry: Registry to read.
+
+    Returns:
+        dict[SampleKey, float]: Sample values keyed by name and sorted labels.
     """
-    # Mock CPU collector
-    mock_cpu = mocker.patch("prod_health_guardian.metrics.collectors.CPUCollector")
-    mock_cpu.return_value.collect = AsyncMock(
-        return_value={
-            "physical_cores": CPU_PHYSICAL_COUNT,
-            "logical_cores": CPU_LOGICAL_COUNT,
-            "cpu_freq_current": CPU_FREQ_CURRENT,
-            "cpu_freq_min": CPU_FREQ_MIN,
-            "cpu_freq_max": CPU_FREQ_MAX,
-            "cpu_percent": CPU_PERCENT_TOTAL,
-            "per_cpu_percent": CPU_PERCENT_PER_CPU,
-            "ctx_switches": CPU_CTX_SWITCHES,
-            "interrupts": CPU_INTERRUPTS,
-            "soft_interrupts": CPU_SOFT_INTERRUPTS,
-            "syscalls": CPU_SYSCALLS,
-        }
-    )
+    return {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for metric in registry.collect()
+        for sample in metric.samples
+    }
 
-    # Mock Memory collector
-    mock_memory = mocker.patch(
-        "prod_health_guardian.metrics.collectors.MemoryCollector"
-    )
-    mock_memory.return_value.collect = AsyncMock(
-        return_value={
-            "total": MEM_VIRTUAL_TOTAL,
-            "available": MEM_VIRTUAL_AVAILABLE,
-            "used": MEM_VIRTUAL_USED,
-            "free": MEM_VIRTUAL_FREE,
-            "percent": MEM_VIRTUAL_PERCENT,
-            "swap_total": MEM_SWAP_TOTAL,
-            "swap_used": MEM_SWAP_USED,
-            "swap_free": MEM_SWAP_FREE,
-            "swap_percent": MEM_SWAP_PERCENT,
-            "swap_in": MEM_SWAP_SIN,
-            "swap_out": MEM_SWAP_SOUT,
-        }
-    )
 
-    # Mock GPU collector
-    mock_gpu = mocker.patch("prod_health_guardian.metrics.collectors.GPUCollector")
-    mock_gpu.return_value.collect = AsyncMock(
-        return_value={
-            "name": GPU_NAME,
-            "temperature": GPU_TEMP_1,
-            "power_watts": GPU_POWER_1,
-            "memory_total": GPU_MEMORY_TOTAL,
-            "memory_used": GPU_MEMORY_USED_1,
-            "memory_free": GPU_MEMORY_FREE_1,
-            "gpu_utilization": GPU_UTIL_1,
-            "memory_utilization": GPU_MEM_UTIL_1,
-            "fan_speed": GPU_FAN_1,
-        }
-    )
+def exposed_value(pattern: re.Pattern[bytes], exposition: bytes) -> float:
+    """Extract the value of a single exposition line.
+
+    Args:
+        pattern: Compiled pattern capturing the sample value.
+        exposition: Prometheus text exposition.
+
+    Returns:
+        float: Parsed sample value.
+    """
+    match = pattern.search(exposition)
+    assert match is not None, pattern.pattern
+    return float(match.group(1))
+
+
+@pytest.fixture(scope="module")
+def shared_registry() -> CollectorRegistry:
+    """Create a Prometheus registry private to this module.
+
+    Returns:
+        CollectorRegistry: Registry backing the shared collector.
+    """
+    return CollectorRegistry()
+
+
+@pytest.fixture(scope="module")
+def shared_collector(shared_registry: CollectorRegistry) -> MetricsCollector:
+    """Create one MetricsCollector for all tests in this module.
+
+    Registering the Prometheus gauges is the expensive part of building a
+    collector, so it is done once against a module-private registry.
+
+    Args:
+        shared_registry: Registry backing the shared collector.
+
+    Returns:
+        MetricsCollector: Collector shared by the tests in this module.
+    """
+    return MetricsCollector(registry=shared_registry)
 
 
 @pytest.fixture
-def collector(mocker: MockerFixture) -> MetricsCollector:
-    """Create a MetricsCollector with mocked collectors."""
-    collector = MetricsCollector()
-    mocker.patch.object(collector.cpu_collector, "collect")
-    mocker.patch.object(collector.memory_collector, "collect")
-    return collector
+def collector(
+    patched_collector: PatchCollector,
+    shared_collector: MetricsCollector,
+    mock_cpu_data: Mapping[str, Any],
+    mock_memory_data: Mapping[str, Any],
+    mock_gpu_data: Mapping[str, Any],
+) -> MetricsCollector:
+    """Reset the shared collector's metrics and mock its hardware collectors.
 
+    Args:
+        patched_collector: Patches a collector to return fixed payloads.
+        shared_collector: Collector shared by the tests in this module.
+        mock_cpu_data: Raw CPU collector output.
+        mock_memory_data: Raw memory collector output.
+        mock_gpu_data: Raw GPU collector output.
+
+    Returns:
+        MetricsCollector: Shared collector with mocked hardware collectors.
+    """
+    for name, metric in vars(shared_collector).items():
+        if name in LABELLED_GAUGES:
+            metric.clear()
+        elif isinstance(metric, Gauge):
+            metric.set(0)
+
+    return patched_collector(
+        shared_collector, mock_cpu_data, mock_memory_data, mock_gpu_data
+    )
 
-@pytest.mark.asyncio
-async def test_collect_metrics(mock_collectors: None) -> None:
+
+async def test_collect_metrics(collector: MetricsCollector) -> None:
     """Test metrics collection.
 
     Args:
-        mock_collectors: Mocked hardware collectors.
+        collector: Metrics collector with mocked hardware collectors.
     """
-    collector = MetricsCollector()
     metrics = await collector.collect_metrics()
 
     assert isinstance(metrics, SystemMetrics)
@@ -171,39 +165,85 @@ async def test_collect_metrics(mock_collectors: None) -> None:
 
     # Verify GPU metrics
     assert metrics.gpu.name == GPU_NAME
-    assert metrics.gpu.temperature == GPU_TEMP_1
-    assert metrics.gpu.power_watts == GPU_POWER_1
+    assert metrics.gpu.temperature == GPU_TEMP
+    assert metrics.gpu.power_watts == GPU_POWER
 
 
-@pytest.mark.asyncio
-async def test_update_prometheus_metrics(mock_collectors: None) -> None:
+async def test_update_prometheus_metrics(
+    collector: MetricsCollector, shared_registry: CollectorRegistry
+) -> None:
     """Test Prometheus metrics update.
 
     Args:
-        mock_collectors: Mocked hardware collectors.
+        collector: Metrics collector with mocked hardware collectors.
+        shared_registry: Registry backing the shared collector.
     """
-    collector = MetricsCollector()
     metrics = await collector.collect_metrics()
     collector.update_prometheus_metrics(metrics)
 
-    metrics_text = collector.get_prometheus_metrics().decode()
+    samples = snapshot(shared_registry)
+    exposition = collector.get_prometheus_metrics()
 
     # CPU metrics
-    assert f"cpu_physical_count {CPU_PHYSICAL_COUNT}.0" in metrics_text
-    assert f"cpu_logical_count {CPU_LOGICAL_COUNT}.0" in metrics_text
-    assert f"cpu_frequency_current_mhz {CPU_FREQ_CURRENT}" in metrics_text
-    assert f'cpu_percent_per_cpu{{core="0"}} {CPU_PERCENT_PER_CPU[0]}' in metrics_text
-    assert f"cpu_ctx_switches_total {CPU_CTX_SWITCHES}.0" in metrics_text
-
-    # Memory metrics - using scientific notation format
-    assert "memory_virtual_total_bytes 1.6e+010" in metrics_text
-    assert "memory_swap_total_bytes 8e+09" in metrics_text
+    assert samples["cpu_physical_count", ()] == CPU_PHYSICAL_COUNT
+    assert samples["cpu_logical_count", ()] == CPU_LOGICAL_COUNT
+    assert samples["cpu_frequency_current_mhz", ()] == CPU_FREQ_CURRENT
+    assert samples["cpu_frequency_min_mhz", ()] == CPU_FREQ_MIN
+    assert samples["cpu_frequency_max_mhz", ()] == CPU_FREQ_MAX
+    assert samples["cpu_percent_total", ()] == CPU_PERCENT_TOTAL
+    for core, percent in enumerate(CPU_PERCENT_PER_CPU):
+        assert samples["cpu_percent_per_cpu", (("core", str(core)),)] == percent
+    assert samples["cpu_ctx_switches_total", ()] == CPU_CTX_SWITCHES
+    assert samples["cpu_interrupts_total", ()] == CPU_INTERRUPTS
+    assert samples["cpu_soft_interrupts_total", ()] == CPU_SOFT_INTERRUPTS
+    assert samples["cpu_syscalls_total", ()] == CPU_SYSCALLS
+
+    # Memory metrics - large values are exported in scientific notation
+    assert exposed_value(_MEM_VIRT_RE, exposition) == MEM_VIRTUAL_TOTAL
+    assert exposed_value(_MEM_SWAP_RE, exposition) == MEM_SWAP_TOTAL
 
     # GPU metrics
-    assert (
-        f'gpu_temperature_celsius{{gpu_id="0",name="{GPU_NAME}"}} {GPU_TEMP_1}'
-        in metrics_text
-    )
-    assert (
-        f'gpu_power_watts{{gpu_id="0",name="{GPU_NAME}"}} {GPU_POWER_1}' in metrics_text
-    )
+    assert exposed_value(_GPU_TEMP_RE, exposition) == GPU_TEMP
+    assert exposed_value(_GPU_POWER_RE, exposition) == GPU_POWER
+
+
+async def test_exposition_round_trips(
+    collector: MetricsCollector, shared_registry: CollectorRegistry
+) -> None:
+    """Test the exposition parses back to exactly the registry's samples.
+
+    Args:
+        collector: Metrics collector with mocked hardware collectors.
+        shared_registry: Registry backing the shared collector.
+    """
+    metrics = await collector.collect_metrics()
+    collector.update_prometheus_metrics(metrics)
+
+    exposition = collector.get_prometheus_metrics().decode("utf-8")
+    parsed = {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for family in text_string_to_metric_families(exposition)
+        for sample in family.samples
+    }
+
+    assert parsed == snapshot(shared_registry)
+
+
+def test_close(registry: CollectorRegistry, mocker: MockerFixture) -> None:
+    """Test closing the collector stops the GPU poller and frees its metrics.
+
+    Args:
+        registry: Isolated Prometheus registry.
+        mocker: Pytest mocker fixture.
+    """
+    collector = MetricsCollector(registry)
+    close = mocker.patch.object(collector.gpu_collector, "close")
+
+    collector.close()
+    collector.close()
+
+    assert collector.closed
+    close.assert_called_once_with()
+    assert not list(registry.collect())
+    # The names are free again for a new collector on the same registry
+    MetricsCollector(registry).close()
@@ -1,16 +1,29 @@
 """Tests for the prometheus metrics module."""
 
+import gc
 from typing import TYPE_CHECKING
 
 import pytest
+from prometheus_client import REGISTRY, CollectorRegistry, generate_latest
 
+from prod_health_guardian.metrics.collectors import MetricsCollector
 from prod_health_guardian.metrics.prometheus import get_collector, get_latest_metrics
+from tests.metrics.conftest import CPU_PERCENT_TOTAL
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import Any
+
     from pytest_mock import MockerFixture
 
+    from tests.conftest import PatchCollector
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# CPU usage reported by the second scrape in test_get_latest_metrics_fresh
+CPU_PERCENT_UPDATED = 75.0
+
 
-@pytest.mark.asyncio
 async def test_get_collector(mocker: "MockerFixture") -> None:
     """Test getting the global collector instance."""
     # First call should create a new instance
@@ -21,8 +34,37 @@ async def test_get_collector(mocker: "MockerFixture") -> None:
     collector2 = get_collector()
     assert collector2 is collector1
 
+    # Passing the global registry explicitly must not build a second one
+    assert get_collector(REGISTRY) is collector1
+
+
+async def test_default_collectors_unregistered() -> None:
+    """Test the client's process, platform and GC metrics are not exported."""
+    exposition = generate_latest(REGISTRY)
+
+    assert b"# HELP process_" not in exposition
+    assert b"# HELP python_info" not in exposition
+    assert b"# HELP python_gc_" not in exposition
+
+
+async def test_get_collector_per_registry(registry: "CollectorRegistry") -> None:
+    """Test a caller's registry gets a new, uncached collector."""
+    collector = get_collector(registry)
+
+    assert collector is not get_collector()
+    assert b"# HELP cpu_percent_total" in generate_latest(registry)
+    collector.close()
+
+
+async def test_collector_on_temporary_registry() -> None:
+    """Test a collector keeps exporting from a registry it alone holds."""
+    collector = MetricsCollector(CollectorRegistry())
+    gc.collect()
+
+    assert b"# HELP cpu_percent_total" in collector.get_prometheus_metrics()
+    collector.close()
+
 
-@pytest.mark.asyncio
 async def test_get_latest_metrics(mocker: "MockerFixture") -> None:
     """Test getting latest metrics in Prometheus format."""
     # Mock the collector methods
@@ -44,3 +86,26 @@ async def test_get_latest_metrics(mocker: "MockerFixture") -> None:
     collector.update_prometheus_metrics.assert_called_once_with(mock_metrics)
     collector.get_prometheus_metrics.assert_called_once()
     assert metrics == mock_prometheus_data
+
+
+async def test_get_latest_metrics_fresh(
+    registry: "CollectorRegistry",
+    patched_collector: "PatchCollector",
+    mock_cpu_data: "Mapping[str, Any]",
+    mock_memory_data: "Mapping[str, Any]",
+    mock_gpu_data: "Mapping[str, Any]",
+) -> None:
+    """Test every scrape runs the real update and serializes the new values."""
+    collector = patched_collector(
+        get_collector(registry), mock_cpu_data, mock_memory_data, mock_gpu_data
+    )
+    first = await collector.get_latest_metrics()
+    collector.cpu_collector.collect.return_value = {
+        **mock_cpu_data,
+        "cpu_percent": CPU_PERCENT_UPDATED,
+    }
+    second = await collector.get_latest_metrics()
+
+    assert f"cpu_percent_total {CPU_PERCENT_TOTAL}" in first
+    assert f"cpu_percent_total {CPU_PERCENT_UPDATED}" in second
+    collector.close()
@@ -1,9 +1,12 @@
 """Tests for data models."""
 
+import json
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from prod_health_guardian import __version__
 from prod_health_guardian.models import (
@@ -54,201 +57,253 @@ GPU_MEMORY_UTILIZATION = 40.0
 GPU_FAN_SPEED = 75.0
 
 # Test data
-VALID_CPU_DATA = {
-    "physical_cores": CPU_PHYSICAL_CORES,
-    "logical_cores": CPU_LOGICAL_CORES,
-    "cpu_freq_current": CPU_FREQ_CURRENT,
-    "cpu_freq_min": CPU_FREQ_MIN,
-    "cpu_freq_max": CPU_FREQ_MAX,
-    "cpu_percent": CPU_PERCENT,
-    "per_cpu_percent": PER_CPU_PERCENT,
-    "ctx_switches": CTX_SWITCHES,
-    "interrupts": INTERRUPTS,
-    "soft_interrupts": SOFT_INTERRUPTS,
-    "syscalls": SYSCALLS,
+VALID_CPU_DATA = MappingProxyType(
+    {
+        "physical_cores": CPU_PHYSICAL_CORES,
+        "logical_cores": CPU_LOGICAL_CORES,
+        "cpu_freq_current": CPU_FREQ_CURRENT,
+        "cpu_freq_min": CPU_FREQ_MIN,
+        "cpu_freq_max": CPU_FREQ_MAX,
+        "cpu_percent": CPU_PERCENT,
+        "per_cpu_percent": PER_CPU_PERCENT,
+        "ctx_switches": CTX_SWITCHES,
+        "interrupts": INTERRUPTS,
+        "soft_interrupts": SOFT_INTERRUPTS,
+        "syscalls": SYSCALLS,
+    }
+)
+
+VALID_MEMORY_DATA = MappingProxyType(
+    {
+        "total": MEM_TOTAL,
+        "available": MEM_AVAILABLE,
+        "used": MEM_USED,
+        "free": MEM_FREE,
+        "percent": MEM_PERCENT,
+        "swap_total": MEM_SWAP_TOTAL,
+        "swap_used": MEM_SWAP_USED,
+        "swap_free": MEM_SWAP_FREE,
+        "swap_percent": MEM_SWAP_PERCENT,
+        "swap_in": MEM_SWAP_IN,
+        "swap_out": MEM_SWAP_OUT,
+    }
+)
+
+VALID_GPU_DATA = MappingProxyType(
+    {
+        "name": GPU_NAME,
+        "temperature": GPU_TEMPERATURE,
+        "power_watts": GPU_POWER_WATTS,
+        "memory_total": GPU_MEMORY_TOTAL,
+        "memory_used": GPU_MEMORY_USED,
+        "memory_free": GPU_MEMORY_FREE,
+        "gpu_utilization": GPU_UTILIZATION,
+        "memory_utilization": GPU_MEMORY_UTILIZATION,
+        "fan_speed": GPU_FAN_SPEED,
+    }
+)
+
+# Invalid payloads. Only type and required-field errors are rejected; the
+# models declare no value ranges, so out-of-range numbers are accepted and
+# do not appear in test_metrics_invalid's bad_fields
+INVALID_CPU_DATA = {
+    "physical_cores": "invalid",  # Should be int
+    "logical_cores": -1,
+    "cpu_freq_current": None,  # Required
+    "cpu_freq_min": "invalid",  # Should be float
+    "cpu_freq_max": -1.0,
+    "cpu_percent": 101.0,
+    "per_cpu_percent": "invalid",  # Should be list
+    "ctx_switches": -1,
+    "interrupts": None,  # Required
+    "soft_interrupts": "invalid",  # Should be int
+    "syscalls": -1,
+}
+
+INVALID_MEMORY_DATA = {
+    "total": "invalid",  # Should be int
+    "available": -1,
+    "used": None,  # Required
+    "free": "invalid",  # Should be int
+    "percent": 101.0,
+    "swap_total": -1,
+    "swap_used": None,  # Required
+    "swap_free": "invalid",  # Should be int
+    "swap_percent": -1.0,
+    "swap_in": None,  # Required
+    "swap_out": "invalid",  # Should be int
 }
 
-VALID_MEMORY_DATA = {
-    "total": MEM_TOTAL,
-    "available": MEM_AVAILABLE,
-    "used": MEM_USED,
-    "free": MEM_FREE,
-    "percent": MEM_PERCENT,
-    "swap_total": MEM_SWAP_TOTAL,
-    "swap_used": MEM_SWAP_USED,
-    "swap_free": MEM_SWAP_FREE,
-    "swap_percent": MEM_SWAP_PERCENT,
-    "swap_in": MEM_SWAP_IN,
-    "swap_out": MEM_SWAP_OUT,
+INVALID_GPU_DATA = {
+    "name": 123,  # Should be string
+    "temperature": "invalid",  # Should be float
+    "power_watts": None,  # Required
+    "memory_total": -1,
+    "memory_used": "invalid",  # Should be int
+    "memory_free": None,  # Required
+    "gpu_utilization": 101.0,
+    "memory_utilization": -1.0,
+    "fan_speed": "invalid",  # Should be float
 }
 
-VALID_GPU_DATA = {
-    "name": GPU_NAME,
-    "temperature": GPU_TEMPERATURE,
-    "power_watts": GPU_POWER_WATTS,
-    "memory_total": GPU_MEMORY_TOTAL,
-    "memory_used": GPU_MEMORY_USED,
-    "memory_free": GPU_MEMORY_FREE,
-    "gpu_utilization": GPU_UTILIZATION,
-    "memory_utilization": GPU_MEMORY_UTILIZATION,
-    "fan_speed": GPU_FAN_SPEED,
+INVALID_SYSTEM_DATA = {
+    "cpu": {},  # Missing required fields
+    "memory": None,  # Required
+    "gpu": "invalid",  # Should be dict
 }
 
+# Built once at import and shared by tests that only need a model. The data
+# is known to be valid (test_metrics_valid checks it), so validation is skipped
+_CPU = CPUMetrics.model_construct(**VALID_CPU_DATA)
+_MEM = MemoryMetrics.model_construct(**VALID_MEMORY_DATA)
+_GPU = GPUMetrics.model_construct(**VALID_GPU_DATA)
 
-@pytest.fixture
-def valid_cpu_metrics() -> dict[str, Any]:
-    """Valid CPU metrics fixture.
+# Serialized once by pydantic's own serializer, for tests that feed JSON in
+VALID_CPU_JSON = _CPU.model_dump_json()
+VALID_MEMORY_JSON = _MEM.model_dump_json()
+VALID_GPU_JSON = _GPU.model_dump_json()
+
+
+@pytest.fixture(scope="session")
+def cpu_model() -> CPUMetrics:
+    """Prebuilt CPU metrics model fixture.
 
     Returns:
-        dict[str, Any]: Valid CPU metrics data.
+        CPUMetrics: CPU metrics built from VALID_CPU_DATA.
     """
-    return VALID_CPU_DATA
+    return _CPU
 
 
-@pytest.fixture
-def valid_memory_metrics() -> dict[str, Any]:
-    """Valid memory metrics fixture.
+@pytest.fixture(scope="session")
+def memory_model() -> MemoryMetrics:
+    """Prebuilt memory metrics model fixture.
 
     Returns:
-        dict[str, Any]: Valid memory metrics data.
+        MemoryMetrics: Memory metrics built from VALID_MEMORY_DATA.
     """
-    return VALID_MEMORY_DATA
+    return _MEM
 
 
-@pytest.fixture
-def valid_gpu_metrics() -> dict[str, Any]:
-    """Valid GPU metrics fixture.
+@pytest.fixture(scope="session")
+def gpu_model() -> GPUMetrics:
+    """Prebuilt GPU metrics model fixture.
 
     Returns:
-        dict[str, Any]: Valid GPU metrics data.
+        GPUMetrics: GPU metrics built from VALID_GPU_DATA.
     """
-    return VALID_GPU_DATA
-
-
-def test_cpu_metrics_valid():
-    """Test valid CPU metrics."""
-    metrics = CPUMetrics(**VALID_CPU_DATA)
-    assert metrics.physical_cores == CPU_PHYSICAL_CORES
-    assert metrics.logical_cores == CPU_LOGICAL_CORES
-    assert metrics.cpu_freq_current == CPU_FREQ_CURRENT
-    assert metrics.cpu_freq_min == CPU_FREQ_MIN
-    assert metrics.cpu_freq_max == CPU_FREQ_MAX
-    assert metrics.cpu_percent == CPU_PERCENT
-    assert metrics.per_cpu_percent == PER_CPU_PERCENT
-    assert metrics.ctx_switches == CTX_SWITCHES
-    assert metrics.interrupts == INTERRUPTS
-    assert metrics.soft_interrupts == SOFT_INTERRUPTS
-    assert metrics.syscalls == SYSCALLS
-
-
-def test_cpu_metrics_invalid():
-    """Test invalid CPU metrics."""
-    invalid_data = {
-        "physical_cores": "invalid",  # Should be int
-        "logical_cores": -1,  # Should be positive
-        "cpu_freq_current": None,  # Required
-        "cpu_freq_min": "invalid",  # Should be float
-        "cpu_freq_max": -1.0,  # Should be positive
-        "cpu_percent": 101.0,  # Should be 0-100
-        "per_cpu_percent": "invalid",  # Should be list
-        "ctx_switches": -1,  # Should be positive
-        "interrupts": None,  # Required
-        "soft_interrupts": "invalid",  # Should be int
-        "syscalls": -1,  # Should be positive
-    }
-    with pytest.raises(ValidationError):
-        CPUMetrics(**invalid_data)
-
-
-def test_memory_metrics_valid():
-    """Test valid memory metrics."""
-    metrics = MemoryMetrics(**VALID_MEMORY_DATA)
-    assert metrics.total == MEM_TOTAL
-    assert metrics.available == MEM_AVAILABLE
-    assert metrics.used == MEM_USED
-    assert metrics.free == MEM_FREE
-    assert metrics.percent == MEM_PERCENT
-    assert metrics.swap_total == MEM_SWAP_TOTAL
-    assert metrics.swap_used == MEM_SWAP_USED
-    assert metrics.swap_free == MEM_SWAP_FREE
-    assert metrics.swap_percent == MEM_SWAP_PERCENT
-    assert metrics.swap_in == MEM_SWAP_IN
-    assert metrics.swap_out == MEM_SWAP_OUT
-
-
-def test_memory_metrics_invalid():
-    """Test invalid memory metrics."""
-    invalid_data = {
-        "total": "invalid",  # Should be int
-        "available": -1,  # Should be positive
-        "used": None,  # Required
-        "free": "invalid",  # Should be int
-        "percent": 101.0,  # Should be 0-100
-        "swap_total": -1,  # Should be positive
-        "swap_used": None,  # Required
-        "swap_free": "invalid",  # Should be int
-        "swap_percent": -1.0,  # Should be 0-100
-        "swap_in": None,  # Required
-        "swap_out": "invalid",  # Should be int
-    }
-    with pytest.raises(ValidationError):
-        MemoryMetrics(**invalid_data)
-
-
-def test_gpu_metrics_valid():
-    """Test valid GPU metrics."""
-    metrics = GPUMetrics(**VALID_GPU_DATA)
-    assert metrics.name == GPU_NAME
-    assert metrics.temperature == GPU_TEMPERATURE
-    assert metrics.power_watts == GPU_POWER_WATTS
-    assert metrics.memory_total == GPU_MEMORY_TOTAL
-    assert metrics.memory_used == GPU_MEMORY_USED
-    assert metrics.memory_free == GPU_MEMORY_FREE
-    assert metrics.gpu_utilization == GPU_UTILIZATION
-    assert metrics.memory_utilization == GPU_MEMORY_UTILIZATION
-    assert metrics.fan_speed == GPU_FAN_SPEED
-
-
-def test_gpu_metrics_invalid():
-    """Test invalid GPU metrics."""
-    invalid_data = {
-        "name": 123,  # Should be string
-        "temperature": "invalid",  # Should be float
-        "power_watts": None,  # Required
-        "memory_total": -1,  # Should be positive
-        "memory_used": "invalid",  # Should be int
-        "memory_free": None,  # Required
-        "gpu_utilization": 101.0,  # Should be 0-100
-        "memory_utilization": -1.0,  # Should be 0-100
-        "fan_speed": "invalid",  # Should be float
-    }
-    with pytest.raises(ValidationError):
-        GPUMetrics(**invalid_data)
+    return _GPU
 
 
-def test_system_metrics_valid():
-    """Test valid system metrics."""
-    metrics = SystemMetrics(
-        cpu=CPUMetrics(**VALID_CPU_DATA),
-        memory=MemoryMetrics(**VALID_MEMORY_DATA),
-        gpu=GPUMetrics(**VALID_GPU_DATA),
-    )
+@pytest.mark.parametrize(
+    ("model_cls", "data"),
+    [
+        (CPUMetrics, VALID_CPU_DATA),
+        (MemoryMetrics, VALID_MEMORY_DATA),
+        (GPUMetrics, VALID_GPU_DATA),
+    ],
+)
+def test_metrics_valid(model_cls: type[BaseModel], data: Mapping[str, Any]) -> None:
+    """Test valid hardware metrics.
+
+    Like test_metrics_invalid, this goes through the class's compiled core
+    validator directly.
+
+    Args:
+        model_cls: Metrics model under test.
+        data: Valid input data, keyed by model field.
+    """
+    metrics = model_cls.__pydantic_validator__.validate_python(data)
+    assert metrics.model_dump(include=set(data)) == data
+
+
+@pytest.mark.parametrize(
+    ("model", "data"),
+    [
+        (_CPU, VALID_CPU_JSON),
+        (_MEM, VALID_MEMORY_JSON),
+        (_GPU, VALID_GPU_JSON),
+    ],
+)
+def test_metrics_valid_json(model: BaseModel, data: str) -> None:
+    """Test hardware metrics validate from their JSON form.
+
+    Args:
+        model: Prebuilt metrics model the JSON was serialized from.
+        data: Valid JSON input.
+    """
+    assert type(model).model_validate_json(data) == model
+
+
+@pytest.mark.parametrize(
+    ("model_cls", "data", "bad_fields"),
+    [
+        (
+            CPUMetrics,
+            INVALID_CPU_DATA,
+            {
+                "physical_cores",
+                "cpu_freq_current",
+                "cpu_freq_min",
+                "per_cpu_percent",
+                "interrupts",
+                "soft_interrupts",
+            },
+        ),
+        (
+            MemoryMetrics,
+            INVALID_MEMORY_DATA,
+            {"total", "used", "free", "swap_used", "swap_free", "swap_in", "swap_out"},
+        ),
+        (
+            GPUMetrics,
+            INVALID_GPU_DATA,
+            {
+                "name",
+                "temperature",
+                "power_watts",
+                "memory_used",
+                "memory_free",
+                "fan_speed",
+            },
+        ),
+        (SystemMetrics, INVALID_SYSTEM_DATA, {"cpu", "memory", "gpu"}),
+    ],
+)
+def test_metrics_invalid(
+    model_cls: type[BaseModel], data: dict[str, Any], bad_fields: set[str]
+) -> None:
+    """Test invalid metrics.
+
+    Validation goes through the class's compiled core validator directly.
+
+    Args:
+        model_cls: Metrics model under test.
+        data: Input data that must fail validation.
+        bad_fields: Fields expected to be reported as invalid.
+    """
+    with pytest.raises(ValidationError) as exc_info:
+        model_cls.__pydantic_validator__.validate_python(data)
+    assert {error["loc"][0] for error in exc_info.value.errors()} == bad_fields
+
+
+def test_system_metrics_valid(
+    cpu_model: CPUMetrics,
+    memory_model: MemoryMetrics,
+    gpu_model: GPUMetrics,
+) -> None:
+    """Test valid system metrics.
+
+    Args:
+        cpu_model: Prebuilt CPU metrics.
+        memory_model: Prebuilt memory metrics.
+        gpu_model: Prebuilt GPU metrics.
+    """
+    metrics = SystemMetrics(cpu=cpu_model, memory=memory_model, gpu=gpu_model)
     assert isinstance(metrics.cpu, CPUMetrics)
     assert isinstance(metrics.memory, MemoryMetrics)
     assert isinstance(metrics.gpu, GPUMetrics)
 
 
-def test_system_metrics_invalid():
-    """Test invalid system metrics."""
-    invalid_data = {
-        "cpu": {},  # Missing required fields
-        "memory": None,  # Required
-        "gpu": "invalid",  # Should be dict
-    }
-    with pytest.raises(ValidationError):
-        SystemMetrics(**invalid_data)
-
-
 def test_health_status_valid() -> None:
     """Test valid health status."""
     data = {
@@ -270,26 +325,39 @@ def test_error_response_valid() -> None:
     response = ErrorResponse(detail="Test error")
     assert response.detail == "Test error"
 
+    # Fields cannot be reassigned once built
+    with pytest.raises(ValidationError):
+        response.detail = "Changed"
+
 
 def test_metrics_response_valid(
-    valid_cpu_metrics: dict[str, Any],
-    valid_memory_metrics: dict[str, Any],
-    valid_gpu_metrics: dict[str, Any],
+    cpu_model: CPUMetrics,
+    memory_model: MemoryMetrics,
+    gpu_model: GPUMetrics,
 ) -> None:
     """Test valid metrics response.
 
     Args:
-        valid_cpu_metrics: Valid CPU metrics data.
-        valid_memory_metrics: Valid memory metrics data.
-        valid_gpu_metrics: Valid GPU metrics data.
+        cpu_model: Prebuilt CPU metrics.
+        memory_model: Prebuilt memory metrics.
+        gpu_model: Prebuilt GPU metrics.
     """
-    response = MetricsResponse(
-        metrics={
-            "cpu": CPUMetrics(**valid_cpu_metrics),
-            "memory": MemoryMetrics(**valid_memory_metrics),
-            "gpu": GPUMetrics(**valid_gpu_metrics),
-        }
+    # metrics is a plain dict[str, Any]; the models in it are already validated
+    response = MetricsResponse.model_construct(
+        metrics={"cpu": cpu_model, "memory": memory_model, "gpu": gpu_model}
     )
     assert isinstance(response.metrics["cpu"], CPUMetrics)
     assert isinstance(response.metrics["memory"], MemoryMetrics)
     assert isinstance(response.metrics["gpu"], GPUMetrics)
+
+    # The validating constructor accepts the same payload unchanged
+    assert MetricsResponse(metrics=response.metrics) == response
+
+    # Serialized in pydantic-core, the way the API boundary emits it
+    assert json.loads(response.model_dump_json()) == {
+        "metrics": {
+            "cpu": dict(VALID_CPU_DATA),
+            "memory": dict(VALID_MEMORY_DATA),
+            "gpu": dict(VALID_GPU_DATA),
+        }
+    }
@@ -1,77 +1,116 @@
 """Test metrics collection and formatting."""
 
-from typing import TYPE_CHECKING
+import re
 
 import pytest
 
 from prod_health_guardian.metrics import get_collector
-from tests.conftest import MEMORY_VIRTUAL_TOTAL
-from tests.utils import AsyncMock
+from tests.conftest import MEMORY_VIRTUAL_TOTAL, PatchCollector
 
-if TYPE_CHECKING:
-    from pytest_mock.plugin import MockerFixture
+# Raw collector output returned by the mocked hardware collectors
+_CPU_PAYLOAD = {
+    "physical_cores": 4,
+    "logical_cores": 8,
+    "cpu_freq_current": 2400.0,
+    "cpu_freq_min": 2200.0,
+    "cpu_freq_max": 3200.0,
+    "cpu_percent": 25.5,
+    "per_cpu_percent": [20.0, 30.0, 25.0, 27.0],
+    "ctx_switches": 1000,
+    "interrupts": 500,
+    "soft_interrupts": 200,
+    "syscalls": 300,
+}
+_MEM_PAYLOAD = {
+    "total": MEMORY_VIRTUAL_TOTAL,
+    "available": 8_000_000_000,
+    "used": 8_000_000_000,
+    "free": 8_000_000_000,
+    "percent": 50.0,
+    "swap_total": 8_000_000_000,
+    "swap_used": 1_000_000_000,
+    "swap_free": 7_000_000_000,
+    "swap_percent": 12.5,
+    "swap_in": 100,
+    "swap_out": 50,
+}
+_GPU_PAYLOAD = {
+    "name": "NVIDIA GeForce RTX 3080",
+    "temperature": 65.0,
+    "power_watts": 220.5,
+    "memory_total": 10_737_418_240,
+    "memory_used": 4_294_967_296,
+    "memory_free": 6_442_450_944,
+    "gpu_utilization": 85.5,
+    "memory_utilization": 40.0,
+    "fan_speed": 75.0,
+}
+_NO_GPU_PAYLOAD = {
+    "name": "No GPU",
+    "temperature": 0.0,
+    "power_watts": 0.0,
+    "memory_total": 0,
+    "memory_used": 0,
+    "memory_free": 0,
+    "gpu_utilization": 0.0,
+    "memory_utilization": 0.0,
+    "fan_speed": 0.0,
+}
 
+# Metric families expected in the Prometheus exposition
+EXPECTED_METRICS = (
+    # CPU metrics
+    "cpu_physical_count",
+    "cpu_logical_count",
+    "cpu_frequency_current_mhz",
+    "cpu_frequency_min_mhz",
+    "cpu_frequency_max_mhz",
+    "cpu_percent_total",
+    "cpu_percent_per_cpu",
+    "cpu_ctx_switches_total",
+    "cpu_interrupts_total",
+    "cpu_soft_interrupts_total",
+    "cpu_syscalls_total",
+    # Memory metrics
+    "memory_virtual_total_bytes",
+    "memory_virtual_available_bytes",
+    "memory_virtual_used_bytes",
+    "memory_virtual_free_bytes",
+    "memory_virtual_percent",
+    "memory_swap_total_bytes",
+    "memory_swap_used_bytes",
+    "memory_swap_free_bytes",
+    "memory_swap_percent",
+    "memory_swap_sin_total",
+    "memory_swap_sout_total",
+    # GPU metrics
+    "gpu_temperature_celsius",
+    "gpu_power_watts",
+    "gpu_memory_total_bytes",
+    "gpu_memory_used_bytes",
+    "gpu_memory_free_bytes",
+    "gpu_utilization_percent",
+    "gpu_memory_utilization_percent",
+    "gpu_fan_speed_percent",
+)
 
-@pytest.mark.asyncio
-async def test_get_latest_metrics(mocker: "MockerFixture") -> None:
-    """Test that get_latest_metrics returns Prometheus formatted metrics."""
-    # Get collector instance
-    collector = get_collector()
+# Metric family names declared by the exposition's "# TYPE" lines
+_TYPE_RE = re.compile(r"^# TYPE (\S+) ", re.MULTILINE)
 
-    # Mock the collect methods
-    cpu_metrics = {
-        "physical_cores": 4,
-        "logical_cores": 8,
-        "cpu_freq_current": 2400.0,
-        "cpu_freq_min": 2200.0,
-        "cpu_freq_max": 3200.0,
-        "cpu_percent": 25.5,
-        "per_cpu_percent": [20.0, 30.0, 25.0, 27.0],
-        "ctx_switches": 1000,
-        "interrupts": 500,
-        "soft_interrupts": 200,
-        "syscalls": 300,
-    }
-    memory_metrics = {
-        "total": MEMORY_VIRTUAL_TOTAL,
-        "available": 8_000_000_000,
-        "used": 8_000_000_000,
-        "free": 8_000_000_000,
-        "percent": 50.0,
-        "swap_total": 8_000_000_000,
-        "swap_used": 1_000_000_000,
-        "swap_free": 7_000_000_000,
-        "swap_percent": 12.5,
-        "swap_in": 100,
-        "swap_out": 50,
-    }
-    gpu_metrics = {
-        "name": "No GPU",
-        "temperature": 0.0,
-        "power_watts": 0.0,
-        "memory_total": 0,
-        "memory_used": 0,
-        "memory_free": 0,
-        "gpu_utilization": 0.0,
-        "memory_utilization": 0.0,
-        "fan_speed": 0.0,
-    }
 
-    # Mock collector methods
-    mocker.patch.object(
-        collector.cpu_collector,
-        "collect",
-        new=AsyncMock(return_value=cpu_metrics),
-    )
-    mocker.patch.object(
-        collector.memory_collector,
-        "collect",
-        new=AsyncMock(return_value=memory_metrics),
-    )
-    mocker.patch.object(
-        collector.gpu_collector,
-        "collect",
-        new=AsyncMock(return_value=gpu_metrics),
+@pytest.mark.parametrize("with_gpu", [True, False], ids=["gpu", "no-gpu"])
+async def test_collector_get_latest_metrics(
+    patched_collector: PatchCollector, with_gpu: bool
+) -> None:
+    """Test that MetricsCollector.get_latest_metrics returns Prometheus text.
+
+    Args:
+        patched_collector: Patches a collector to return fixed payloads.
+        with_gpu: Whether the GPU collector reports a device or "No GPU".
+    """
+    gpu_payload = _GPU_PAYLOAD if with_gpu else _NO_GPU_PAYLOAD
+    collector = patched_collector(
+        get_collector(), _CPU_PAYLOAD, _MEM_PAYLOAD, gpu_payload
     )
 
     # Get metrics
@@ -82,38 +121,7 @@ async def test_get_latest_metrics(mocker: "MockerFixture") -> None:
     assert "HELP" in metrics
     assert "TYPE" in metrics
 
-    # Validate CPU metrics
-    assert "cpu_physical_count" in metrics
-    assert "cpu_logical_count" in metrics
-    assert "cpu_frequency_current_mhz" in metrics
-    assert "cpu_frequency_min_mhz" in metrics
-    assert "cpu_frequency_max_mhz" in metrics
-    assert "cpu_percent_total" in metrics
-    assert "cpu_percent_per_cpu" in metrics
-    assert "cpu_ctx_switches_total" in metrics
-    assert "cpu_interrupts_total" in metrics
-    assert "cpu_soft_interrupts_total" in metrics
-    assert "cpu_syscalls_total" in metrics
-
-    # Validate memory metrics
-    assert "memory_virtual_total_bytes" in metrics
-    assert "memory_virtual_available_bytes" in metrics
-    assert "memory_virtual_used_bytes" in metrics
-    assert "memory_virtual_free_bytes" in metrics
-    assert "memory_virtual_percent" in metrics
-    assert "memory_swap_total_bytes" in metrics
-    assert "memory_swap_used_bytes" in metrics
-    assert "memory_swap_free_bytes" in metrics
-    assert "memory_swap_percent" in metrics
-    assert "memory_swap_sin_total" in metrics
-    assert "memory_swap_sout_total" in metrics
-
-    # Validate GPU metrics
-    assert "gpu_temperature_celsius" in metrics
-    assert "gpu_power_watts" in metrics
-    assert "gpu_memory_total_bytes" in metrics
-    assert "gpu_memory_used_bytes" in metrics
-    assert "gpu_memory_free_bytes" in metrics
-    assert "gpu_utilization_percent" in metrics
-    assert "gpu_memory_utilization_percent" in metrics
-    assert "gpu_fan_speed_percent" in metrics
+    # Validate all expected metric families are exported
+    missing = set(EXPECTED_METRICS).difference(_TYPE_RE.findall(metrics))
+    assert not missing, missing
+    assert f'name="{gpu_payload["name"]}"' in metrics
@@ -1,12 +1,12 @@
 """Basic tests to verify test infrastructure."""
 
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from pytest_mock import MockerFixture
+from unittest.mock import Mock
 
 MOCK_RETURN_VALUE = 42
 
+# Built once for the module; the test only reads its return value
+_MOCK = Mock(return_value=MOCK_RETURN_VALUE)
+
 
 def test_basic_setup() -> None:
     """Basic test to verify pytest setup is working.
@@ -17,11 +17,6 @@ def test_basic_setup() -> None:
     assert True
 
 
-def test_mock_example(mocker: "MockerFixture") -> None:
-    """Example test demonstrating mock usage.
-
-    Args:
-        mocker: Pytest fixture for mocking.
-    """
-    mock = mocker.Mock(return_value=MOCK_RETURN_VALUE)
-    assert mock() == MOCK_RETURN_VALUE
+def test_mock_example() -> None:
+    """Example test demonstrating mock usage."""
+    assert _MOCK() == MOCK_RETURN_VALUE